@@ -2,8 +2,39 @@
 Growth Advisory module for customer/user growth advice (a1-a9).
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List
-from .base import BaseModule, BaseSubmodule
+from .base import BaseModule, BaseSubmodule, LazySubmodules
+
+
+# Request-dependent strings are memoized on their (hashable) inputs, so repeat
+# requests skip re-formatting them
+_ADVICE_CACHE_SIZE = 512
+
+# Simulated advice is held in read-only module-level constants (tuples and
+# MappingProxyType), defined just above the sub-module whose response
+# prototype uses them; responses get plain dict/list copies
+
+# Budget/pricing-model lookup tables
+_CHANNELS_BY_BUDGET = MappingProxyType({
+    'low': ('Social media', 'Content marketing', 'Email marketing'),
+    'medium': ('Paid advertising', 'SEO', 'Influencer partnerships'),
+    'high': ('TV advertising', 'Major partnerships', 'Large-scale events')
+})
+
+_PRICING_BY_MODEL = MappingProxyType({
+    'subscription': ('Tiered pricing', 'Usage-based pricing', 'Annual discounts'),
+    'one_time': ('Bundle pricing', 'Volume discounts', 'Premium features'),
+    'freemium': ('Feature gating', 'Premium upgrades', 'Enterprise pricing')
+})
+_DEFAULT_PRICING = ('Value-based pricing', 'Competitive pricing')
+
+_CHANNEL_MIX_BY_BUDGET = MappingProxyType({
+    'low': MappingProxyType({'social_media': 0.4, 'content_marketing': 0.3, 'email': 0.2, 'seo': 0.1}),
+    'medium': MappingProxyType({'paid_ads': 0.3, 'social_media': 0.25, 'content': 0.2, 'email': 0.15, 'seo': 0.1}),
+    'high': MappingProxyType({'paid_ads': 0.4, 'events': 0.2, 'social_media': 0.2, 'content': 0.1, 'pr': 0.1})
+})
 
 
 class GrowthAdvisoryModule(BaseModule):
@@ -11,450 +42,502 @@ class GrowthAdvisoryModule(BaseModule):
     Growth Advisory module for customer/user growth advice (a1-a9).
     """
     
+    __slots__ = ()
+    
     def _initialize_submodules(self):
-        """Initialize a1-a9 submodules."""
-        self.submodules = {
-            1: A1CustomerAcquisition(self.config.get('a1', {})),
-            2: A2UserRetention(self.config.get('a2', {})),
-            3: A3MarketExpansion(self.config.get('a3', {})),
-            4: A4RevenueOptimization(self.config.get('a4', {})),
-            5: A5ProductDevelopment(self.config.get('a5', {})),
-            6: A6MarketingStrategy(self.config.get('a6', {})),
-            7: A7CompetitiveAnalysis(self.config.get('a7', {})),
-            8: A8DataAnalytics(self.config.get('a8', {})),
-            9: A9GrowthMetrics(self.config.get('a9', {}))
-        }
+        """Initialize a1-a9 submodules (constructed lazily on first access)."""
+        self.submodules = LazySubmodules(_SUBMODULE_CLASSES, 'a', self.config)
     
     def get_description(self) -> str:
         return "Customer/user growth and business development advice"
 
 
+_A1_ACQUISITION_STRATEGY = MappingProxyType({
+    'primary_channels': ('Digital marketing', 'Content marketing', 'Social media'),
+    'secondary_channels': ('Partnerships', 'Referral programs', 'Events'),
+    'timeline': '3-6 months for initial results',
+    'expected_outcomes': '20-30% increase in customer base'
+})
+
+_A1_COST_ANALYSIS = MappingProxyType({
+    'estimated_budget': '$5,000 - $15,000 per month',
+    'cost_per_acquisition': '$50 - $150',
+    'roi_expectation': '3-5x return on investment',
+    'break_even_time': '6-12 months'
+})
+
+
 class A1CustomerAcquisition(BaseSubmodule):
     """a1: Strategies for acquiring new customers and users."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Strategies for acquiring new customers and users"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'business_type': None,
+        'target_audience': None,
+        'budget': None,
+        'acquisition_strategy': _A1_ACQUISITION_STRATEGY,
+        'channels': None,
+        'cost_analysis': _A1_COST_ANALYSIS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         business_type = request.get('business_type', '')
         target_audience = request.get('target_audience', {})
         budget = request.get('budget', 'medium')
         
-        acquisition_strategy = self._develop_acquisition_strategy(business_type, target_audience, budget)
-        
-        return {
-            'business_type': business_type,
-            'target_audience': target_audience,
-            'budget': budget,
-            'acquisition_strategy': acquisition_strategy,
-            'channels': self._recommend_channels(business_type, budget),
-            'cost_analysis': self._analyze_costs(acquisition_strategy)
-        }
-    
-    def _develop_acquisition_strategy(self, business_type: str, audience: Dict, budget: str) -> Dict[str, Any]:
-        return {
-            'primary_channels': ['Digital marketing', 'Content marketing', 'Social media'],
-            'secondary_channels': ['Partnerships', 'Referral programs', 'Events'],
-            'timeline': '3-6 months for initial results',
-            'expected_outcomes': '20-30% increase in customer base'
-        }
-    
-    def _recommend_channels(self, business_type: str, budget: str) -> List[str]:
-        channels = {
-            'low': ['Social media', 'Content marketing', 'Email marketing'],
-            'medium': ['Paid advertising', 'SEO', 'Influencer partnerships'],
-            'high': ['TV advertising', 'Major partnerships', 'Large-scale events']
-        }
-        return channels.get(budget, channels['medium'])
-    
-    def _analyze_costs(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'estimated_budget': '$5,000 - $15,000 per month',
-            'cost_per_acquisition': '$50 - $150',
-            'roi_expectation': '3-5x return on investment',
-            'break_even_time': '6-12 months'
-        }
-    
-    def get_description(self) -> str:
-        return "Strategies for acquiring new customers and users"
+        return self._new_response(
+            business_type=business_type,
+            target_audience=target_audience,
+            budget=budget,
+            channels=self._recommend_channels(budget)
+        )
+    
+    @staticmethod
+    def _recommend_channels(budget: str) -> List[str]:
+        return list(_CHANNELS_BY_BUDGET.get(budget, _CHANNELS_BY_BUDGET['medium']))
+
+
+_A2_SUCCESS_METRICS = MappingProxyType({
+    'retention_rate_target': '80%',
+    'engagement_metrics': ('Daily active users', 'Session duration', 'Feature usage'),
+    'satisfaction_score': '4.5/5',
+    'churn_reduction': '25% decrease'
+})
+
+_A2_IMPROVEMENT_OPPORTUNITIES = (
+    'Improve customer support response time',
+    'Enhance product features based on user requests',
+    'Create more engaging content',
+    'Implement better onboarding process'
+)
 
 
 class A2UserRetention(BaseSubmodule):
     """a2: Strategies for retaining existing customers and users."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Strategies for retaining existing customers and users"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_retention': None,
+        'user_feedback': None,
+        'business_model': None,
+        'retention_strategy': None,
+        'improvement_opportunities': _A2_IMPROVEMENT_OPPORTUNITIES,
+        'success_metrics': _A2_SUCCESS_METRICS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_retention_rate = request.get('current_retention', 0.7)
         user_feedback = request.get('user_feedback', [])
         business_model = request.get('business_model', 'subscription')
         
-        retention_strategy = self._develop_retention_strategy(current_retention_rate, user_feedback, business_model)
-        
-        return {
-            'current_retention': current_retention_rate,
-            'user_feedback': user_feedback,
-            'business_model': business_model,
-            'retention_strategy': retention_strategy,
-            'improvement_opportunities': self._identify_opportunities(user_feedback),
-            'success_metrics': self._define_success_metrics(retention_strategy)
-        }
-    
-    def _develop_retention_strategy(self, current_rate: float, feedback: List[str], model: str) -> Dict[str, Any]:
+        return self._new_response(
+            current_retention=current_retention_rate,
+            user_feedback=user_feedback,
+            business_model=business_model,
+            retention_strategy=self._develop_retention_strategy(current_retention_rate)
+        )
+    
+    def _develop_retention_strategy(self, current_rate: float) -> Dict[str, Any]:
         return {
             'loyalty_programs': ['Points system', 'Exclusive benefits', 'Early access'],
             'engagement_tactics': ['Personalized content', 'Regular communication', 'Community building'],
             'value_enhancement': ['Feature improvements', 'Better support', 'Educational content'],
-            'target_improvement': f'Increase retention from {current_rate:.1%} to {(current_rate + 0.1):.1%}'
-        }
-    
-    def _identify_opportunities(self, feedback: List[str]) -> List[str]:
-        return [
-            'Improve customer support response time',
-            'Enhance product features based on user requests',
-            'Create more engaging content',
-            'Implement better onboarding process'
-        ]
-    
-    def _define_success_metrics(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'retention_rate_target': '80%',
-            'engagement_metrics': ['Daily active users', 'Session duration', 'Feature usage'],
-            'satisfaction_score': '4.5/5',
-            'churn_reduction': '25% decrease'
+            'target_improvement': self._format_target(current_rate)
         }
     
-    def get_description(self) -> str:
-        return "Strategies for retaining existing customers and users"
+    @staticmethod
+    @lru_cache(maxsize=_ADVICE_CACHE_SIZE)
+    def _format_target(current_rate: float) -> str:
+        return f'Increase retention from {current_rate:.1%} to {(current_rate + 0.1):.1%}'
+
+
+_A3_EXPANSION_STRATEGY = MappingProxyType({
+    'target_markets': ('Geographic expansion', 'Demographic expansion', 'Product line expansion'),
+    'entry_strategies': ('Partnerships', 'Direct entry', 'Acquisitions'),
+    'timeline': '12-24 months for market entry',
+    'investment_required': '$100,000 - $500,000'
+})
+
+_A3_RISK_ASSESSMENT = MappingProxyType({
+    'market_risk': 'Medium - requires thorough research',
+    'financial_risk': 'High - significant investment required',
+    'operational_risk': 'Medium - scaling challenges',
+    'mitigation_strategies': ('Pilot programs', 'Local partnerships', 'Gradual rollout')
+})
+
+_A3_MARKET_OPPORTUNITIES = (
+    'Emerging markets with high growth potential',
+    'Underserved customer segments',
+    'Adjacent product categories',
+    'International markets with similar demographics'
+)
 
 
 class A3MarketExpansion(BaseSubmodule):
     """a3: Strategies for expanding into new markets."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Strategies for expanding into new markets"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_markets': None,
+        'expansion_goals': None,
+        'resources_available': None,
+        'expansion_strategy': _A3_EXPANSION_STRATEGY,
+        'market_opportunities': _A3_MARKET_OPPORTUNITIES,
+        'risk_assessment': _A3_RISK_ASSESSMENT
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_markets = request.get('current_markets', [])
         expansion_goals = request.get('expansion_goals', [])
         resources_available = request.get('resources', 'medium')
         
-        expansion_strategy = self._develop_expansion_strategy(current_markets, expansion_goals, resources_available)
-        
-        return {
-            'current_markets': current_markets,
-            'expansion_goals': expansion_goals,
-            'resources_available': resources_available,
-            'expansion_strategy': expansion_strategy,
-            'market_opportunities': self._identify_market_opportunities(expansion_goals),
-            'risk_assessment': self._assess_expansion_risks(expansion_strategy)
-        }
-    
-    def _develop_expansion_strategy(self, current: List[str], goals: List[str], resources: str) -> Dict[str, Any]:
-        return {
-            'target_markets': ['Geographic expansion', 'Demographic expansion', 'Product line expansion'],
-            'entry_strategies': ['Partnerships', 'Direct entry', 'Acquisitions'],
-            'timeline': '12-24 months for market entry',
-            'investment_required': '$100,000 - $500,000'
-        }
-    
-    def _identify_market_opportunities(self, goals: List[str]) -> List[str]:
-        return [
-            'Emerging markets with high growth potential',
-            'Underserved customer segments',
-            'Adjacent product categories',
-            'International markets with similar demographics'
-        ]
-    
-    def _assess_expansion_risks(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'market_risk': 'Medium - requires thorough research',
-            'financial_risk': 'High - significant investment required',
-            'operational_risk': 'Medium - scaling challenges',
-            'mitigation_strategies': ['Pilot programs', 'Local partnerships', 'Gradual rollout']
-        }
-    
-    def get_description(self) -> str:
-        return "Strategies for expanding into new markets"
+        return self._new_response(
+            current_markets=current_markets,
+            expansion_goals=expansion_goals,
+            resources_available=resources_available
+        )
+
+
+_A4_OPTIMIZATION_STRATEGY = MappingProxyType({
+    'pricing_optimization': ('Value-based pricing', 'Dynamic pricing', 'Tiered pricing'),
+    'revenue_diversification': ('New product lines', 'Services', 'Partnerships'),
+    'cost_optimization': ('Operational efficiency', 'Automation', 'Scale economies'),
+    'target_increase': '25-40% revenue growth'
+})
+
+_A4_REVENUE_PROJECTIONS = MappingProxyType({
+    'short_term': '15-25% increase in 6 months',
+    'medium_term': '30-50% increase in 12 months',
+    'long_term': '50-100% increase in 24 months',
+    'key_drivers': ('Pricing optimization', 'Market expansion', 'Product development')
+})
 
 
 class A4RevenueOptimization(BaseSubmodule):
     """a4: Optimize revenue streams and pricing strategies."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Optimize revenue streams and pricing strategies"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_revenue': None,
+        'revenue_streams': None,
+        'pricing_model': None,
+        'optimization_strategy': _A4_OPTIMIZATION_STRATEGY,
+        'pricing_recommendations': None,
+        'revenue_projections': _A4_REVENUE_PROJECTIONS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_revenue = request.get('current_revenue', 0)
         revenue_streams = request.get('revenue_streams', [])
         pricing_model = request.get('pricing_model', 'subscription')
         
-        optimization_strategy = self._develop_optimization_strategy(current_revenue, revenue_streams, pricing_model)
-        
-        return {
-            'current_revenue': current_revenue,
-            'revenue_streams': revenue_streams,
-            'pricing_model': pricing_model,
-            'optimization_strategy': optimization_strategy,
-            'pricing_recommendations': self._recommend_pricing_strategies(pricing_model),
-            'revenue_projections': self._project_revenue_growth(optimization_strategy)
-        }
-    
-    def _develop_optimization_strategy(self, current: int, streams: List[str], model: str) -> Dict[str, Any]:
-        return {
-            'pricing_optimization': ['Value-based pricing', 'Dynamic pricing', 'Tiered pricing'],
-            'revenue_diversification': ['New product lines', 'Services', 'Partnerships'],
-            'cost_optimization': ['Operational efficiency', 'Automation', 'Scale economies'],
-            'target_increase': '25-40% revenue growth'
-        }
-    
-    def _recommend_pricing_strategies(self, model: str) -> List[str]:
-        strategies = {
-            'subscription': ['Tiered pricing', 'Usage-based pricing', 'Annual discounts'],
-            'one_time': ['Bundle pricing', 'Volume discounts', 'Premium features'],
-            'freemium': ['Feature gating', 'Premium upgrades', 'Enterprise pricing']
-        }
-        return strategies.get(model, ['Value-based pricing', 'Competitive pricing'])
-    
-    def _project_revenue_growth(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'short_term': '15-25% increase in 6 months',
-            'medium_term': '30-50% increase in 12 months',
-            'long_term': '50-100% increase in 24 months',
-            'key_drivers': ['Pricing optimization', 'Market expansion', 'Product development']
-        }
-    
-    def get_description(self) -> str:
-        return "Optimize revenue streams and pricing strategies"
+        return self._new_response(
+            current_revenue=current_revenue,
+            revenue_streams=revenue_streams,
+            pricing_model=pricing_model,
+            pricing_recommendations=self._recommend_pricing_strategies(pricing_model)
+        )
+    
+    @staticmethod
+    def _recommend_pricing_strategies(model: str) -> List[str]:
+        return list(_PRICING_BY_MODEL.get(model, _DEFAULT_PRICING))
+
+
+_A5_DEVELOPMENT_PLAN = MappingProxyType({
+    'development_phases': ('Research', 'Design', 'Development', 'Testing', 'Launch'),
+    'timeline': '6-12 months for major features',
+    'team_requirements': ('Product manager', 'Developers', 'Designers', 'QA'),
+    'success_criteria': ('User adoption', 'Performance metrics', 'Revenue impact')
+})
+
+_A5_ROADMAP = MappingProxyType({
+    'q1': ('User research', 'Feature design'),
+    'q2': ('Core development', 'Initial testing'),
+    'q3': ('Advanced features', 'Beta testing'),
+    'q4': ('Launch preparation', 'Market rollout')
+})
+
+_A5_FEATURE_PRIORITIES = (
+    MappingProxyType({'feature': 'Core functionality', 'priority': 'High', 'effort': 'Medium'}),
+    MappingProxyType({'feature': 'User experience improvements', 'priority': 'High', 'effort': 'Low'}),
+    MappingProxyType({'feature': 'Advanced features', 'priority': 'Medium', 'effort': 'High'}),
+    MappingProxyType({'feature': 'Nice-to-have features', 'priority': 'Low', 'effort': 'Medium'})
+)
 
 
 class A5ProductDevelopment(BaseSubmodule):
     """a5: Guide product development and feature prioritization."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Guide product development and feature prioritization"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_product': None,
+        'user_needs': None,
+        'development_resources': None,
+        'development_plan': _A5_DEVELOPMENT_PLAN,
+        'feature_prioritization': _A5_FEATURE_PRIORITIES,
+        'roadmap': _A5_ROADMAP
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_product = request.get('current_product', {})
         user_needs = request.get('user_needs', [])
         development_resources = request.get('resources', 'medium')
         
-        development_plan = self._create_development_plan(current_product, user_needs, development_resources)
-        
-        return {
-            'current_product': current_product,
-            'user_needs': user_needs,
-            'development_resources': development_resources,
-            'development_plan': development_plan,
-            'feature_prioritization': self._prioritize_features(user_needs),
-            'roadmap': self._create_product_roadmap(development_plan)
-        }
-    
-    def _create_development_plan(self, current: Dict, needs: List[str], resources: str) -> Dict[str, Any]:
-        return {
-            'development_phases': ['Research', 'Design', 'Development', 'Testing', 'Launch'],
-            'timeline': '6-12 months for major features',
-            'team_requirements': ['Product manager', 'Developers', 'Designers', 'QA'],
-            'success_criteria': ['User adoption', 'Performance metrics', 'Revenue impact']
-        }
-    
-    def _prioritize_features(self, needs: List[str]) -> List[Dict[str, Any]]:
-        return [
-            {'feature': 'Core functionality', 'priority': 'High', 'effort': 'Medium'},
-            {'feature': 'User experience improvements', 'priority': 'High', 'effort': 'Low'},
-            {'feature': 'Advanced features', 'priority': 'Medium', 'effort': 'High'},
-            {'feature': 'Nice-to-have features', 'priority': 'Low', 'effort': 'Medium'}
-        ]
-    
-    def _create_product_roadmap(self, plan: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'q1': ['User research', 'Feature design'],
-            'q2': ['Core development', 'Initial testing'],
-            'q3': ['Advanced features', 'Beta testing'],
-            'q4': ['Launch preparation', 'Market rollout']
-        }
-    
-    def get_description(self) -> str:
-        return "Guide product development and feature prioritization"
+        return self._new_response(
+            current_product=current_product,
+            user_needs=user_needs,
+            development_resources=development_resources
+        )
+
+
+_A6_MARKETING_STRATEGY = MappingProxyType({
+    'brand_positioning': 'Clear, differentiated value proposition',
+    'messaging_strategy': 'Consistent, compelling communication',
+    'channel_strategy': 'Multi-channel approach with focus on high-performing channels',
+    'content_strategy': 'Educational, engaging, and conversion-focused content'
+})
+
+_A6_CAMPAIGN_IDEAS = (
+    'Educational content series',
+    'User-generated content campaign',
+    'Influencer partnerships',
+    'Limited-time promotions',
+    'Community building initiatives'
+)
 
 
 class A6MarketingStrategy(BaseSubmodule):
     """a6: Develop comprehensive marketing strategies."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Develop comprehensive marketing strategies"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'target_audience': None,
+        'marketing_goals': None,
+        'budget': None,
+        'marketing_strategy': _A6_MARKETING_STRATEGY,
+        'channel_mix': None,
+        'campaign_ideas': _A6_CAMPAIGN_IDEAS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         target_audience = request.get('target_audience', {})
         marketing_goals = request.get('marketing_goals', [])
         budget = request.get('budget', 'medium')
         
-        marketing_strategy = self._develop_marketing_strategy(target_audience, marketing_goals, budget)
-        
-        return {
-            'target_audience': target_audience,
-            'marketing_goals': marketing_goals,
-            'budget': budget,
-            'marketing_strategy': marketing_strategy,
-            'channel_mix': self._recommend_channel_mix(budget),
-            'campaign_ideas': self._generate_campaign_ideas(marketing_goals)
-        }
-    
-    def _develop_marketing_strategy(self, audience: Dict, goals: List[str], budget: str) -> Dict[str, Any]:
-        return {
-            'brand_positioning': 'Clear, differentiated value proposition',
-            'messaging_strategy': 'Consistent, compelling communication',
-            'channel_strategy': 'Multi-channel approach with focus on high-performing channels',
-            'content_strategy': 'Educational, engaging, and conversion-focused content'
-        }
-    
-    def _recommend_channel_mix(self, budget: str) -> Dict[str, float]:
-        mixes = {
-            'low': {'social_media': 0.4, 'content_marketing': 0.3, 'email': 0.2, 'seo': 0.1},
-            'medium': {'paid_ads': 0.3, 'social_media': 0.25, 'content': 0.2, 'email': 0.15, 'seo': 0.1},
-            'high': {'paid_ads': 0.4, 'events': 0.2, 'social_media': 0.2, 'content': 0.1, 'pr': 0.1}
-        }
-        return mixes.get(budget, mixes['medium'])
-    
-    def _generate_campaign_ideas(self, goals: List[str]) -> List[str]:
-        return [
-            'Educational content series',
-            'User-generated content campaign',
-            'Influencer partnerships',
-            'Limited-time promotions',
-            'Community building initiatives'
-        ]
-    
-    def get_description(self) -> str:
-        return "Develop comprehensive marketing strategies"
+        return self._new_response(
+            target_audience=target_audience,
+            marketing_goals=marketing_goals,
+            budget=budget,
+            channel_mix=self._recommend_channel_mix(budget)
+        )
+    
+    @staticmethod
+    def _recommend_channel_mix(budget: str) -> Dict[str, float]:
+        return _CHANNEL_MIX_BY_BUDGET.get(budget, _CHANNEL_MIX_BY_BUDGET['medium']).copy()
+
+
+_A7_COMPETITIVE_ANALYSIS = MappingProxyType({
+    'market_share': 'Competitive landscape analysis',
+    'strengths_weaknesses': 'SWOT analysis for each competitor',
+    'pricing_strategies': 'Competitive pricing analysis',
+    'product_features': 'Feature comparison matrix',
+    'marketing_approaches': 'Competitive marketing analysis'
+})
+
+_A7_ADVANTAGES = (
+    'Superior product quality',
+    'Better customer service',
+    'More competitive pricing',
+    'Unique features or capabilities',
+    'Stronger brand recognition'
+)
+
+_A7_RECOMMENDATIONS = (
+    'Differentiate through unique value propositions',
+    'Focus on underserved market segments',
+    'Improve competitive advantages',
+    'Monitor competitor movements',
+    'Develop strategic partnerships'
+)
 
 
 class A7CompetitiveAnalysis(BaseSubmodule):
     """a7: Analyze competitors and market positioning."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Analyze competitors and market positioning"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'competitors': None,
+        'market_position': None,
+        'analysis_focus': None,
+        'competitive_analysis': _A7_COMPETITIVE_ANALYSIS,
+        'competitive_advantages': _A7_ADVANTAGES,
+        'strategic_recommendations': _A7_RECOMMENDATIONS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         competitors = request.get('competitors', [])
         market_position = request.get('market_position', '')
         analysis_focus = request.get('focus', 'comprehensive')
         
-        competitive_analysis = self._conduct_competitive_analysis(competitors, market_position, analysis_focus)
-        
-        return {
-            'competitors': competitors,
-            'market_position': market_position,
-            'analysis_focus': analysis_focus,
-            'competitive_analysis': competitive_analysis,
-            'competitive_advantages': self._identify_advantages(competitive_analysis),
-            'strategic_recommendations': self._generate_recommendations(competitive_analysis)
-        }
-    
-    def _conduct_competitive_analysis(self, competitors: List[str], position: str, focus: str) -> Dict[str, Any]:
-        return {
-            'market_share': 'Competitive landscape analysis',
-            'strengths_weaknesses': 'SWOT analysis for each competitor',
-            'pricing_strategies': 'Competitive pricing analysis',
-            'product_features': 'Feature comparison matrix',
-            'marketing_approaches': 'Competitive marketing analysis'
-        }
-    
-    def _identify_advantages(self, analysis: Dict[str, Any]) -> List[str]:
-        return [
-            'Superior product quality',
-            'Better customer service',
-            'More competitive pricing',
-            'Unique features or capabilities',
-            'Stronger brand recognition'
-        ]
-    
-    def _generate_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
-        return [
-            'Differentiate through unique value propositions',
-            'Focus on underserved market segments',
-            'Improve competitive advantages',
-            'Monitor competitor movements',
-            'Develop strategic partnerships'
-        ]
-    
-    def get_description(self) -> str:
-        return "Analyze competitors and market positioning"
+        return self._new_response(
+            competitors=competitors,
+            market_position=market_position,
+            analysis_focus=analysis_focus
+        )
+
+
+_A8_ANALYTICS_STRATEGY = MappingProxyType({
+    'data_collection': 'Comprehensive data gathering strategy',
+    'analysis_framework': 'Structured approach to data analysis',
+    'reporting_system': 'Regular insights and reporting',
+    'actionable_insights': 'Data-driven decision making'
+})
+
+_A8_KEY_METRICS = (
+    'Customer acquisition cost (CAC)',
+    'Customer lifetime value (CLV)',
+    'Conversion rates',
+    'Retention rates',
+    'Revenue growth',
+    'User engagement metrics'
+)
+
+_A8_INSIGHTS_OPPORTUNITIES = (
+    'User behavior patterns',
+    'Conversion funnel optimization',
+    'Customer segmentation insights',
+    'Product usage analytics',
+    'Market trend analysis'
+)
 
 
 class A8DataAnalytics(BaseSubmodule):
     """a8: Leverage data analytics for growth insights."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Leverage data analytics for growth insights"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'available_data': None,
+        'analytics_goals': None,
+        'technical_capabilities': None,
+        'analytics_strategy': _A8_ANALYTICS_STRATEGY,
+        'key_metrics': _A8_KEY_METRICS,
+        'insights_opportunities': _A8_INSIGHTS_OPPORTUNITIES
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         available_data = request.get('available_data', {})
         analytics_goals = request.get('analytics_goals', [])
         technical_capabilities = request.get('capabilities', 'basic')
         
-        analytics_strategy = self._develop_analytics_strategy(available_data, analytics_goals, technical_capabilities)
-        
-        return {
-            'available_data': available_data,
-            'analytics_goals': analytics_goals,
-            'technical_capabilities': technical_capabilities,
-            'analytics_strategy': analytics_strategy,
-            'key_metrics': self._identify_key_metrics(analytics_goals),
-            'insights_opportunities': self._identify_insights_opportunities(available_data)
-        }
-    
-    def _develop_analytics_strategy(self, data: Dict, goals: List[str], capabilities: str) -> Dict[str, Any]:
-        return {
-            'data_collection': 'Comprehensive data gathering strategy',
-            'analysis_framework': 'Structured approach to data analysis',
-            'reporting_system': 'Regular insights and reporting',
-            'actionable_insights': 'Data-driven decision making'
-        }
-    
-    def _identify_key_metrics(self, goals: List[str]) -> List[str]:
-        return [
-            'Customer acquisition cost (CAC)',
-            'Customer lifetime value (CLV)',
-            'Conversion rates',
-            'Retention rates',
-            'Revenue growth',
-            'User engagement metrics'
-        ]
-    
-    def _identify_insights_opportunities(self, data: Dict) -> List[str]:
-        return [
-            'User behavior patterns',
-            'Conversion funnel optimization',
-            'Customer segmentation insights',
-            'Product usage analytics',
-            'Market trend analysis'
-        ]
-    
-    def get_description(self) -> str:
-        return "Leverage data analytics for growth insights"
+        return self._new_response(
+            available_data=available_data,
+            analytics_goals=analytics_goals,
+            technical_capabilities=technical_capabilities
+        )
+
+
+_A9_METRICS_FRAMEWORK = MappingProxyType({
+    'acquisition_metrics': ('CAC', 'Conversion rates', 'Channel performance'),
+    'engagement_metrics': ('DAU/MAU', 'Session duration', 'Feature usage'),
+    'retention_metrics': ('Churn rate', 'Retention cohorts', 'LTV'),
+    'revenue_metrics': ('MRR', 'ARPU', 'Revenue growth'),
+    'operational_metrics': ('Support tickets', 'Response times', 'Satisfaction scores')
+})
+
+_A9_KPI_DASHBOARD = MappingProxyType({
+    'executive_dashboard': ('Revenue growth', 'Customer growth', 'Key business metrics'),
+    'operational_dashboard': ('Daily metrics', 'Team performance', 'Operational efficiency'),
+    'product_dashboard': ('User engagement', 'Feature adoption', 'Product performance'),
+    'marketing_dashboard': ('Campaign performance', 'Channel metrics', 'ROI analysis')
+})
+
+_A9_TRACKING_IMPLEMENTATION = MappingProxyType({
+    'data_sources': ('Analytics tools', 'CRM systems', 'Financial systems'),
+    'tracking_tools': ('Google Analytics', 'Mixpanel', 'Custom dashboards'),
+    'reporting_frequency': ('Daily', 'Weekly', 'Monthly'),
+    'implementation_timeline': '4-8 weeks for full setup'
+})
 
 
 class A9GrowthMetrics(BaseSubmodule):
     """a9: Define and track growth metrics and KPIs."""
     
+    __slots__ = ()
+    
+    DESCRIPTION = "Define and track growth metrics and KPIs"
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'business_model': None,
+        'growth_stage': None,
+        'tracking_capabilities': None,
+        'metrics_framework': _A9_METRICS_FRAMEWORK,
+        'kpi_dashboard': _A9_KPI_DASHBOARD,
+        'tracking_implementation': _A9_TRACKING_IMPLEMENTATION
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         business_model = request.get('business_model', '')
         growth_stage = request.get('growth_stage', 'early')
         tracking_capabilities = request.get('tracking', 'basic')
         
-        metrics_framework = self._create_metrics_framework(business_model, growth_stage, tracking_capabilities)
-        
-        return {
-            'business_model': business_model,
-            'growth_stage': growth_stage,
-            'tracking_capabilities': tracking_capabilities,
-            'metrics_framework': metrics_framework,
-            'kpi_dashboard': self._design_kpi_dashboard(metrics_framework),
-            'tracking_implementation': self._plan_tracking_implementation(metrics_framework)
-        }
-    
-    def _create_metrics_framework(self, model: str, stage: str, tracking: str) -> Dict[str, Any]:
-        return {
-            'acquisition_metrics': ['CAC', 'Conversion rates', 'Channel performance'],
-            'engagement_metrics': ['DAU/MAU', 'Session duration', 'Feature usage'],
-            'retention_metrics': ['Churn rate', 'Retention cohorts', 'LTV'],
-            'revenue_metrics': ['MRR', 'ARPU', 'Revenue growth'],
-            'operational_metrics': ['Support tickets', 'Response times', 'Satisfaction scores']
-        }
-    
-    def _design_kpi_dashboard(self, framework: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'executive_dashboard': ['Revenue growth', 'Customer growth', 'Key business metrics'],
-            'operational_dashboard': ['Daily metrics', 'Team performance', 'Operational efficiency'],
-            'product_dashboard': ['User engagement', 'Feature adoption', 'Product performance'],
-            'marketing_dashboard': ['Campaign performance', 'Channel metrics', 'ROI analysis']
-        }
-    
-    def _plan_tracking_implementation(self, framework: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'data_sources': ['Analytics tools', 'CRM systems', 'Financial systems'],
-            'tracking_tools': ['Google Analytics', 'Mixpanel', 'Custom dashboards'],
-            'reporting_frequency': ['Daily', 'Weekly', 'Monthly'],
-            'implementation_timeline': '4-8 weeks for full setup'
-        }
-    
-    def get_description(self) -> str:
-        return "Define and track growth metrics and KPIs" 
\ No newline at end of file
+        return self._new_response(
+            business_model=business_model,
+            growth_stage=growth_stage,
+            tracking_capabilities=tracking_capabilities
+        )
+
+
+# a1-a9 in sub-module ID order
+_SUBMODULE_CLASSES = (
+    A1CustomerAcquisition,
+    A2UserRetention,
+    A3MarketExpansion,
+    A4RevenueOptimization,
+    A5ProductDevelopment,
+    A6MarketingStrategy,
+    A7CompetitiveAnalysis,
+    A8DataAnalytics,
+    A9GrowthMetrics,
+)
@@ -2,8 +2,25 @@
 Interview/Job module for interview preparation and job assistance (b1-b9).
 """
 
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 from typing import Dict, Any, List
-from .base import BaseModule, BaseSubmodule
+from .base import BaseModule, BaseSubmodule, LazySubmodules
+
+
+# Request-dependent strings are memoized on their (hashable) inputs, so repeat
+# requests skip re-formatting them. Free-text request fields (resume content,
+# company names) are not used as cache keys.
+_ADVICE_CACHE_SIZE = 512
+
+# B6 compares current and target skills with plain list scans unless both
+# lists are longer than this; then the current skills are hashed first
+_SKILL_SCAN_LIMIT = 16
+
+# Simulated advice is held in read-only module-level constants (tuples and
+# MappingProxyType), defined just above the sub-module that uses them;
+# responses get plain dict/list copies
 
 
 class InterviewJobModule(BaseModule):
@@ -11,81 +28,111 @@ class InterviewJobModule(BaseModule):
     Interview/Job module for interview preparation and job assistance (b1-b9).
     """
     
+    __slots__ = ()
+    
     def _initialize_submodules(self):
-        """Initialize b1-b9 submodules."""
-        self.submodules = {
-            1: B1InterviewPreparation(self.config.get('b1', {})),
-            2: B2ResumeOptimization(self.config.get('b2', {})),
-            3: B3JobSearchStrategy(self.config.get('b3', {})),
-            4: B4SalaryNegotiation(self.config.get('b4', {})),
-            5: B5CareerPlanning(self.config.get('b5', {})),
-            6: B6SkillDevelopment(self.config.get('b6', {})),
-            7: B7NetworkingAdvice(self.config.get('b7', {})),
-            8: B8CompanyResearch(self.config.get('b8', {})),
-            9: B9JobMarketAnalysis(self.config.get('b9', {}))
-        }
+        """Initialize b1-b9 submodules (constructed lazily on first access)."""
+        self.submodules = LazySubmodules(_SUBMODULE_CLASSES, 'b', self.config)
     
     def get_description(self) -> str:
         return "Interview preparation and job-related AI assistance"
 
 
+_B1_PREPARATION_PLAN = MappingProxyType({
+    'research_phase': ('Company background', 'Industry trends', 'Role requirements'),
+    'practice_phase': ('Mock interviews', 'Question preparation', 'Story development'),
+    'logistics_phase': ('Interview location', 'Dress code', 'Materials needed'),
+    'timeline': '1-2 weeks preparation recommended'
+})
+
+_B1_PRACTICE_QUESTIONS = MappingProxyType({
+    'behavioral': (
+        'Tell me about a time you faced a challenge at work',
+        'Describe a situation where you had to work with a difficult colleague',
+        'Give an example of when you went above and beyond'
+    ),
+    'technical': (
+        'Explain your approach to solving complex problems',
+        'Describe your experience with relevant technologies',
+        'How do you stay updated with industry trends?'
+    )
+})
+_B1_DEFAULT_QUESTIONS = ('Standard interview questions',)
+
+_B1_PREPARATION_TIPS = (
+    'Research the company thoroughly',
+    'Prepare specific examples from your experience',
+    'Practice your responses out loud',
+    'Prepare thoughtful questions to ask'
+)
+
+
 class B1InterviewPreparation(BaseSubmodule):
     """b1: Prepare for job interviews with AI assistance."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'job_position': None,
+        'company': None,
+        'interview_type': None,
+        'preparation_plan': _B1_PREPARATION_PLAN,
+        'practice_questions': None,
+        'preparation_tips': _B1_PREPARATION_TIPS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         job_position = request.get('position', '')
         company = request.get('company', '')
         interview_type = request.get('interview_type', 'behavioral')
         
-        preparation_plan = self._create_preparation_plan(job_position, company, interview_type)
-        
-        return {
-            'job_position': job_position,
-            'company': company,
-            'interview_type': interview_type,
-            'preparation_plan': preparation_plan,
-            'practice_questions': self._generate_practice_questions(job_position, interview_type),
-            'preparation_tips': self._provide_preparation_tips(interview_type)
-        }
-    
-    def _create_preparation_plan(self, position: str, company: str, interview_type: str) -> Dict[str, Any]:
-        return {
-            'research_phase': ['Company background', 'Industry trends', 'Role requirements'],
-            'practice_phase': ['Mock interviews', 'Question preparation', 'Story development'],
-            'logistics_phase': ['Interview location', 'Dress code', 'Materials needed'],
-            'timeline': '1-2 weeks preparation recommended'
-        }
+        return self._new_response(
+            job_position=job_position,
+            company=company,
+            interview_type=interview_type,
+            practice_questions=self._generate_practice_questions(job_position, interview_type)
+        )
     
     def _generate_practice_questions(self, position: str, interview_type: str) -> List[str]:
-        questions = {
-            'behavioral': [
-                'Tell me about a time you faced a challenge at work',
-                'Describe a situation where you had to work with a difficult colleague',
-                'Give an example of when you went above and beyond'
-            ],
-            'technical': [
-                'Explain your approach to solving complex problems',
-                'Describe your experience with relevant technologies',
-                'How do you stay updated with industry trends?'
-            ]
-        }
-        return questions.get(interview_type, ['Standard interview questions'])
-    
-    def _provide_preparation_tips(self, interview_type: str) -> List[str]:
-        return [
-            'Research the company thoroughly',
-            'Prepare specific examples from your experience',
-            'Practice your responses out loud',
-            'Prepare thoughtful questions to ask'
-        ]
+        return list(_B1_PRACTICE_QUESTIONS.get(interview_type, _B1_DEFAULT_QUESTIONS))
     
     def get_description(self) -> str:
         return "Prepare for job interviews with AI assistance"
 
 
+_B2_IMPROVEMENTS = (
+    'Added relevant keywords',
+    'Improved formatting',
+    'Enhanced achievement descriptions',
+    'Better section organization'
+)
+
+_B2_ATS_COMPATIBILITY = MappingProxyType({
+    'compatibility_score': 92.5,
+    'keyword_density': 'Optimal',
+    'formatting': 'ATS-friendly',
+    'suggestions': ('Consider adding more industry-specific keywords',)
+})
+
+
 class B2ResumeOptimization(BaseSubmodule):
     """b2: Optimize resumes for better job applications."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'original_resume': None,
+        'target_position': None,
+        'industry': None,
+        'optimized_resume': None,
+        'improvements_made': _B2_IMPROVEMENTS,
+        'ats_compatibility': _B2_ATS_COMPATIBILITY
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         resume_content = request.get('resume_content', '')
         target_position = request.get('target_position', '')
@@ -93,98 +140,110 @@ class B2ResumeOptimization(BaseSubmodule):
         
         optimized_resume = self._optimize_resume(resume_content, target_position, industry)
         
-        return {
-            'original_resume': resume_content,
-            'target_position': target_position,
-            'industry': industry,
-            'optimized_resume': optimized_resume,
-            'improvements_made': self._list_improvements(resume_content, optimized_resume),
-            'ats_compatibility': self._check_ats_compatibility(optimized_resume)
-        }
+        return self._new_response(
+            original_resume=resume_content,
+            target_position=target_position,
+            industry=industry,
+            optimized_resume=optimized_resume
+        )
     
     def _optimize_resume(self, content: str, position: str, industry: str) -> str:
         # Simulate resume optimization
-        optimizations = [
-            'Enhanced keyword optimization',
-            'Improved action verbs',
-            'Better formatting and structure',
-            'Quantified achievements added'
-        ]
         return f"Optimized resume for {position} in {industry} industry"
     
-    def _list_improvements(self, original: str, optimized: str) -> List[str]:
-        return [
-            'Added relevant keywords',
-            'Improved formatting',
-            'Enhanced achievement descriptions',
-            'Better section organization'
-        ]
-    
-    def _check_ats_compatibility(self, resume: str) -> Dict[str, Any]:
-        return {
-            'compatibility_score': 92.5,
-            'keyword_density': 'Optimal',
-            'formatting': 'ATS-friendly',
-            'suggestions': ['Consider adding more industry-specific keywords']
-        }
-    
     def get_description(self) -> str:
         return "Optimize resumes for better job applications"
 
 
+_B3_SEARCH_STRATEGY = MappingProxyType({
+    'phase_1': 'Research and preparation (2 weeks)',
+    'phase_2': 'Active application and networking (6 weeks)',
+    'phase_3': 'Interview preparation and follow-up (2 weeks)',
+    'key_channels': ('LinkedIn', 'Company websites', 'Professional networks'),
+    'target_companies': ('Top 10 companies in your field',),
+    'networking_approach': 'Informational interviews and industry events'
+})
+
+_B3_ACTION_PLAN = (
+    'Update professional profiles',
+    'Research target companies',
+    'Network with industry professionals',
+    'Apply to 5-10 positions weekly',
+    'Follow up on applications'
+)
+
+_B3_SUCCESS_METRICS = MappingProxyType({
+    'applications_per_week': 10,
+    'networking_contacts': 20,
+    'interview_rate': '15%',
+    'offer_timeline': '8-12 weeks'
+})
+
+
 class B3JobSearchStrategy(BaseSubmodule):
     """b3: Develop effective job search strategies."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'career_goals': None,
+        'current_situation': None,
+        'search_timeline': None,
+        'search_strategy': _B3_SEARCH_STRATEGY,
+        'action_plan': _B3_ACTION_PLAN,
+        'success_metrics': _B3_SUCCESS_METRICS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         career_goals = request.get('career_goals', [])
         current_situation = request.get('current_situation', '')
         search_timeline = request.get('timeline', '3 months')
         
-        search_strategy = self._develop_search_strategy(career_goals, current_situation, search_timeline)
-        
-        return {
-            'career_goals': career_goals,
-            'current_situation': current_situation,
-            'search_timeline': search_timeline,
-            'search_strategy': search_strategy,
-            'action_plan': self._create_action_plan(search_strategy),
-            'success_metrics': self._define_success_metrics(search_strategy)
-        }
-    
-    def _develop_search_strategy(self, goals: List[str], situation: str, timeline: str) -> Dict[str, Any]:
-        return {
-            'phase_1': 'Research and preparation (2 weeks)',
-            'phase_2': 'Active application and networking (6 weeks)',
-            'phase_3': 'Interview preparation and follow-up (2 weeks)',
-            'key_channels': ['LinkedIn', 'Company websites', 'Professional networks'],
-            'target_companies': ['Top 10 companies in your field'],
-            'networking_approach': 'Informational interviews and industry events'
-        }
-    
-    def _create_action_plan(self, strategy: Dict[str, Any]) -> List[str]:
-        return [
-            'Update professional profiles',
-            'Research target companies',
-            'Network with industry professionals',
-            'Apply to 5-10 positions weekly',
-            'Follow up on applications'
-        ]
-    
-    def _define_success_metrics(self, strategy: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'applications_per_week': 10,
-            'networking_contacts': 20,
-            'interview_rate': '15%',
-            'offer_timeline': '8-12 weeks'
-        }
+        return self._new_response(
+            career_goals=career_goals,
+            current_situation=current_situation,
+            search_timeline=search_timeline
+        )
     
     def get_description(self) -> str:
         return "Develop effective job search strategies"
 
 
+_B4_NEGOTIATION_SCRIPTS = (
+    "Thank you for the offer. Based on my research and experience...",
+    "I'm excited about this opportunity, and I'd like to discuss the compensation...",
+    "I appreciate the offer, and I'd like to explore the possibility of..."
+)
+
+
+_B4_SALARY_RANGE = MappingProxyType({
+    'market_average': 75000,
+    'range_min': 65000,
+    'range_max': 85000,
+    'percentile_25': 70000,
+    'percentile_75': 80000
+})
+
+
 class B4SalaryNegotiation(BaseSubmodule):
     """b4: Provide salary negotiation guidance and strategies."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_salary': None,
+        'target_position': None,
+        'experience_level': None,
+        'location': None,
+        'negotiation_guidance': None,
+        'salary_range': _B4_SALARY_RANGE,
+        'negotiation_scripts': _B4_NEGOTIATION_SCRIPTS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_salary = request.get('current_salary', 0)
         target_position = request.get('target_position', '')
@@ -193,47 +252,61 @@ class B4SalaryNegotiation(BaseSubmodule):
         
         negotiation_guidance = self._provide_negotiation_guidance(current_salary, target_position, experience_level, location)
         
-        return {
-            'current_salary': current_salary,
-            'target_position': target_position,
-            'experience_level': experience_level,
-            'location': location,
-            'negotiation_guidance': negotiation_guidance,
-            'salary_range': self._research_salary_range(target_position, experience_level, location),
-            'negotiation_scripts': self._create_negotiation_scripts()
-        }
+        return self._new_response(
+            current_salary=current_salary,
+            target_position=target_position,
+            experience_level=experience_level,
+            location=location,
+            negotiation_guidance=negotiation_guidance
+        )
     
     def _provide_negotiation_guidance(self, current: int, position: str, level: str, location: str) -> Dict[str, Any]:
         return {
-            'target_salary_range': f"${current * 1.15:.0f} - ${current * 1.25:.0f}",
+            'target_salary_range': self._format_target_range(current),
             'negotiation_strategy': 'Research-based approach with multiple offers',
             'key_talking_points': ['Market value', 'Experience level', 'Company benefits'],
             'timing': 'After receiving offer, before accepting'
         }
     
-    def _research_salary_range(self, position: str, level: str, location: str) -> Dict[str, Any]:
-        return {
-            'market_average': 75000,
-            'range_min': 65000,
-            'range_max': 85000,
-            'percentile_25': 70000,
-            'percentile_75': 80000
-        }
-    
-    def _create_negotiation_scripts(self) -> List[str]:
-        return [
-            "Thank you for the offer. Based on my research and experience...",
-            "I'm excited about this opportunity, and I'd like to discuss the compensation...",
-            "I appreciate the offer, and I'd like to explore the possibility of..."
-        ]
+    @staticmethod
+    @lru_cache(maxsize=_ADVICE_CACHE_SIZE)
+    def _format_target_range(current: int) -> str:
+        return f"${current * 1.15:.0f} - ${current * 1.25:.0f}"
     
     def get_description(self) -> str:
         return "Provide salary negotiation guidance and strategies"
 
 
+_B5_MILESTONES = (
+    MappingProxyType({'year': 1, 'milestone': 'Complete advanced certification'}),
+    MappingProxyType({'year': 2, 'milestone': 'Lead a major project'}),
+    MappingProxyType({'year': 3, 'milestone': 'Promotion to senior role'}),
+    MappingProxyType({'year': 5, 'milestone': 'Achieve career aspiration'})
+)
+
+_B5_DEVELOPMENT_PATH = MappingProxyType({
+    'skill_development': ('Online courses', 'Mentorship', 'On-the-job training'),
+    'networking': ('Industry conferences', 'Professional associations', 'Social media'),
+    'experience_building': ('Project leadership', 'Cross-functional collaboration', 'Innovation initiatives')
+})
+
+
 class B5CareerPlanning(BaseSubmodule):
     """b5: Help with long-term career planning and development."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_role': None,
+        'career_aspirations': None,
+        'timeline': None,
+        'career_plan': None,
+        'milestones': _B5_MILESTONES,
+        'development_path': _B5_DEVELOPMENT_PATH
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_role = request.get('current_role', '')
         career_aspirations = request.get('aspirations', [])
@@ -241,14 +314,12 @@ class B5CareerPlanning(BaseSubmodule):
         
         career_plan = self._create_career_plan(current_role, career_aspirations, timeline)
         
-        return {
-            'current_role': current_role,
-            'career_aspirations': career_aspirations,
-            'timeline': timeline,
-            'career_plan': career_plan,
-            'milestones': self._define_milestones(career_plan),
-            'development_path': self._outline_development_path(career_plan)
-        }
+        return self._new_response(
+            current_role=current_role,
+            career_aspirations=career_aspirations,
+            timeline=timeline,
+            career_plan=career_plan
+        )
     
     def _create_career_plan(self, current: str, aspirations: List[str], timeline: str) -> Dict[str, Any]:
         return {
@@ -259,28 +330,39 @@ class B5CareerPlanning(BaseSubmodule):
             'timeline': timeline
         }
     
-    def _define_milestones(self, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return [
-            {'year': 1, 'milestone': 'Complete advanced certification'},
-            {'year': 2, 'milestone': 'Lead a major project'},
-            {'year': 3, 'milestone': 'Promotion to senior role'},
-            {'year': 5, 'milestone': 'Achieve career aspiration'}
-        ]
-    
-    def _outline_development_path(self, plan: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'skill_development': ['Online courses', 'Mentorship', 'On-the-job training'],
-            'networking': ['Industry conferences', 'Professional associations', 'Social media'],
-            'experience_building': ['Project leadership', 'Cross-functional collaboration', 'Innovation initiatives']
-        }
-    
     def get_description(self) -> str:
         return "Help with long-term career planning and development"
 
 
+_B6_LEARNING_RESOURCES = MappingProxyType({
+    'online_courses': ('Coursera', 'Udemy', 'edX'),
+    'books': ('Industry-specific guides', 'Technical manuals'),
+    'practices': ('Personal projects', 'Open source contributions')
+})
+
+_B6_PROGRESS_TRACKING = MappingProxyType({
+    'milestones': ('Course completion', 'Project delivery', 'Skill assessment'),
+    'metrics': ('Time spent learning', 'Projects completed', 'Skill level improvement'),
+    'review_schedule': 'Monthly progress reviews'
+})
+
+
 class B6SkillDevelopment(BaseSubmodule):
     """b6: Recommend skill development opportunities."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'current_skills': None,
+        'target_skills': None,
+        'learning_preferences': None,
+        'development_plan': None,
+        'learning_resources': _B6_LEARNING_RESOURCES,
+        'progress_tracking': _B6_PROGRESS_TRACKING
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         current_skills = request.get('current_skills', [])
         target_skills = request.get('target_skills', [])
@@ -288,16 +370,20 @@ class B6SkillDevelopment(BaseSubmodule):
         
         development_plan = self._create_skill_development_plan(current_skills, target_skills, learning_preferences)
         
-        return {
-            'current_skills': current_skills,
-            'target_skills': target_skills,
-            'learning_preferences': learning_preferences,
-            'development_plan': development_plan,
-            'learning_resources': self._recommend_learning_resources(target_skills),
-            'progress_tracking': self._create_progress_tracking(development_plan)
-        }
+        return self._new_response(
+            current_skills=current_skills,
+            target_skills=target_skills,
+            learning_preferences=learning_preferences,
+            development_plan=development_plan
+        )
     
     def _create_skill_development_plan(self, current: List[str], target: List[str], preferences: Dict) -> Dict[str, Any]:
+        if (isinstance(current, (list, tuple)) and len(current) > _SKILL_SCAN_LIMIT
+                and isinstance(target, (list, tuple)) and len(target) > _SKILL_SCAN_LIMIT
+                and all(isinstance(skill, str) for skill in chain(current, target))):
+            # Hash lookups instead of a scan of the current skills per target;
+            # only for strings, as other elements (e.g. dicts) may be unhashable
+            current = frozenset(current)
         return {
             'skill_gaps': [skill for skill in target if skill not in current],
             'learning_path': ['Beginner courses', 'Intermediate projects', 'Advanced applications'],
@@ -305,74 +391,94 @@ class B6SkillDevelopment(BaseSubmodule):
             'learning_methods': ['Online courses', 'Hands-on projects', 'Mentorship']
         }
     
-    def _recommend_learning_resources(self, target_skills: List[str]) -> Dict[str, List[str]]:
-        return {
-            'online_courses': ['Coursera', 'Udemy', 'edX'],
-            'books': ['Industry-specific guides', 'Technical manuals'],
-            'practices': ['Personal projects', 'Open source contributions']
-        }
-    
-    def _create_progress_tracking(self, plan: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'milestones': ['Course completion', 'Project delivery', 'Skill assessment'],
-            'metrics': ['Time spent learning', 'Projects completed', 'Skill level improvement'],
-            'review_schedule': 'Monthly progress reviews'
-        }
-    
     def get_description(self) -> str:
         return "Recommend skill development opportunities"
 
 
+_B7_NETWORKING_STRATEGY = MappingProxyType({
+    'target_connections': ('Industry leaders', 'Peers', 'Mentors'),
+    'networking_channels': ('LinkedIn', 'Industry events', 'Professional associations'),
+    'approach': 'Value-first networking with genuine interest',
+    'frequency': 'Weekly networking activities'
+})
+
+_B7_NETWORKING_EVENTS = (
+    'Industry conferences and trade shows',
+    'Professional association meetings',
+    'Local business networking groups',
+    'Online industry forums and webinars'
+)
+
+_B7_FOLLOW_UP_STRATEGIES = (
+    'Send personalized thank you messages',
+    'Share relevant articles or insights',
+    'Schedule follow-up meetings',
+    'Maintain regular contact through social media'
+)
+
+
 class B7NetworkingAdvice(BaseSubmodule):
     """b7: Provide networking advice and strategies."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'networking_goals': None,
+        'current_network': None,
+        'industry': None,
+        'networking_strategy': _B7_NETWORKING_STRATEGY,
+        'networking_events': _B7_NETWORKING_EVENTS,
+        'follow_up_strategies': _B7_FOLLOW_UP_STRATEGIES
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         networking_goals = request.get('goals', [])
         current_network = request.get('current_network', {})
         industry = request.get('industry', '')
         
-        networking_strategy = self._develop_networking_strategy(networking_goals, current_network, industry)
-        
-        return {
-            'networking_goals': networking_goals,
-            'current_network': current_network,
-            'industry': industry,
-            'networking_strategy': networking_strategy,
-            'networking_events': self._recommend_networking_events(industry),
-            'follow_up_strategies': self._create_follow_up_strategies()
-        }
-    
-    def _develop_networking_strategy(self, goals: List[str], current: Dict, industry: str) -> Dict[str, Any]:
-        return {
-            'target_connections': ['Industry leaders', 'Peers', 'Mentors'],
-            'networking_channels': ['LinkedIn', 'Industry events', 'Professional associations'],
-            'approach': 'Value-first networking with genuine interest',
-            'frequency': 'Weekly networking activities'
-        }
-    
-    def _recommend_networking_events(self, industry: str) -> List[str]:
-        return [
-            'Industry conferences and trade shows',
-            'Professional association meetings',
-            'Local business networking groups',
-            'Online industry forums and webinars'
-        ]
-    
-    def _create_follow_up_strategies(self) -> List[str]:
-        return [
-            'Send personalized thank you messages',
-            'Share relevant articles or insights',
-            'Schedule follow-up meetings',
-            'Maintain regular contact through social media'
-        ]
+        return self._new_response(
+            networking_goals=networking_goals,
+            current_network=current_network,
+            industry=industry
+        )
     
     def get_description(self) -> str:
         return "Provide networking advice and strategies"
 
 
+_B8_INTERVIEW_PREPARATION = (
+    'Prepare questions about company culture',
+    'Research recent company news',
+    'Understand company values and mission',
+    'Study company products/services'
+)
+
+_B8_KEY_INSIGHTS = (
+    'Company is growing rapidly in the market',
+    'Strong focus on innovation and technology',
+    'Employee satisfaction scores are high',
+    'Recent expansion into new markets'
+)
+
+
 class B8CompanyResearch(BaseSubmodule):
     """b8: Research companies for job applications and interviews."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'company_name': None,
+        'research_focus': None,
+        'industry_context': None,
+        'company_research': None,
+        'interview_preparation': _B8_INTERVIEW_PREPARATION,
+        'company_insights': _B8_KEY_INSIGHTS
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         company_name = request.get('company_name', '')
         research_focus = request.get('focus', 'comprehensive')
@@ -380,14 +486,12 @@ class B8CompanyResearch(BaseSubmodule):
         
         company_research = self._research_company(company_name, research_focus, industry_context)
         
-        return {
-            'company_name': company_name,
-            'research_focus': research_focus,
-            'industry_context': industry_context,
-            'company_research': company_research,
-            'interview_preparation': self._prepare_for_interview(company_research),
-            'company_insights': self._extract_key_insights(company_research)
-        }
+        return self._new_response(
+            company_name=company_name,
+            research_focus=research_focus,
+            industry_context=industry_context,
+            company_research=company_research
+        )
     
     def _research_company(self, name: str, focus: str, industry: str) -> Dict[str, Any]:
         return {
@@ -398,69 +502,73 @@ class B8CompanyResearch(BaseSubmodule):
             'leadership_team': 'Key executives and their backgrounds'
         }
     
-    def _prepare_for_interview(self, research: Dict[str, Any]) -> List[str]:
-        return [
-            'Prepare questions about company culture',
-            'Research recent company news',
-            'Understand company values and mission',
-            'Study company products/services'
-        ]
-    
-    def _extract_key_insights(self, research: Dict[str, Any]) -> List[str]:
-        return [
-            'Company is growing rapidly in the market',
-            'Strong focus on innovation and technology',
-            'Employee satisfaction scores are high',
-            'Recent expansion into new markets'
-        ]
-    
     def get_description(self) -> str:
         return "Research companies for job applications and interviews"
 
 
+_B9_MARKET_ANALYSIS = MappingProxyType({
+    'market_growth': '15% year-over-year growth',
+    'demand_trends': 'High demand for technical skills',
+    'salary_trends': 'Increasing compensation packages',
+    'skill_requirements': ('Technical skills', 'Soft skills', 'Industry knowledge'),
+    'competitive_landscape': 'Growing competition for top talent'
+})
+
+_B9_TRENDS = (
+    'Remote work becoming standard',
+    'Focus on digital transformation skills',
+    'Increased demand for data analytics',
+    'Growing importance of soft skills'
+)
+
+_B9_OPPORTUNITIES = (
+    'Emerging roles in AI and machine learning',
+    'Opportunities in remote work positions',
+    'Growing demand for cybersecurity professionals',
+    'Expansion in healthcare technology'
+)
+
+
 class B9JobMarketAnalysis(BaseSubmodule):
     """b9: Analyze job market trends and opportunities."""
     
+    __slots__ = ()
+    
+    # Response prototype: shared sections, None for per-request fields
+    # (process() takes a plain copy and fills those in)
+    _RESPONSE = MappingProxyType({
+        'target_industry': None,
+        'location': None,
+        'analysis_period': None,
+        'market_analysis': _B9_MARKET_ANALYSIS,
+        'trends': _B9_TRENDS,
+        'opportunities': _B9_OPPORTUNITIES
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         target_industry = request.get('industry', '')
         location = request.get('location', '')
         analysis_period = request.get('period', '6 months')
         
-        market_analysis = self._analyze_job_market(target_industry, location, analysis_period)
-        
-        return {
-            'target_industry': target_industry,
-            'location': location,
-            'analysis_period': analysis_period,
-            'market_analysis': market_analysis,
-            'trends': self._identify_trends(market_analysis),
-            'opportunities': self._identify_opportunities(market_analysis)
-        }
-    
-    def _analyze_job_market(self, industry: str, location: str, period: str) -> Dict[str, Any]:
-        return {
-            'market_growth': '15% year-over-year growth',
-            'demand_trends': 'High demand for technical skills',
-            'salary_trends': 'Increasing compensation packages',
-            'skill_requirements': ['Technical skills', 'Soft skills', 'Industry knowledge'],
-            'competitive_landscape': 'Growing competition for top talent'
-        }
-    
-    def _identify_trends(self, analysis: Dict[str, Any]) -> List[str]:
-        return [
-            'Remote work becoming standard',
-            'Focus on digital transformation skills',
-            'Increased demand for data analytics',
-            'Growing importance of soft skills'
-        ]
-    
-    def _identify_opportunities(self, analysis: Dict[str, Any]) -> List[str]:
-        return [
-            'Emerging roles in AI and machine learning',
-            'Opportunities in remote work positions',
-            'Growing demand for cybersecurity professionals',
-            'Expansion in healthcare technology'
-        ]
+        return self._new_response(
+            target_industry=target_industry,
+            location=location,
+            analysis_period=analysis_period
+        )
     
     def get_description(self) -> str:
-        return "Analyze job market trends and opportunities" 
\ No newline at end of file
+        return "Analyze job market trends and opportunities"
+
+
+# b1-b9 in sub-module ID order
+_SUBMODULE_CLASSES = (
+    B1InterviewPreparation,
+    B2ResumeOptimization,
+    B3JobSearchStrategy,
+    B4SalaryNegotiation,
+    B5CareerPlanning,
+    B6SkillDevelopment,
+    B7NetworkingAdvice,
+    B8CompanyResearch,
+    B9JobMarketAnalysis,
+)
@@ -2,8 +2,19 @@
 Base module class for all mornGPT modules.
 """
 
+import json
+import keyword
+import math
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from collections.abc import Mapping
+from threading import Lock
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Type
+
+
+# Compact JSON encoding; read-only mappings are encoded as plain objects.
+# One shared encoder: json.dumps() builds a new one per call whenever
+# non-default options are passed
+_dumps = json.JSONEncoder(separators=(',', ':'), default=dict).encode
 
 
 class BaseModule(ABC):
@@ -11,6 +22,8 @@ class BaseModule(ABC):
     Base class for all mornGPT modules.
     """
     
+    __slots__ = ('config', 'submodules')
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize base module.
@@ -48,6 +61,30 @@ class BaseModule(ABC):
         
         return self.submodules[submodule_id]
     
+    def process_batch(self, items: Sequence[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of requests addressed to any of the sub-modules.
+        
+        Requests are grouped by sub-module, so each sub-module is looked up
+        once per batch rather than once per request.
+        
+        Args:
+            items: (sub-module ID, request data) pairs
+            
+        Returns:
+            Response data, in item order
+        """
+        groups = {}
+        for index, (submodule_id, _) in enumerate(items):
+            groups.setdefault(submodule_id, []).append(index)
+        
+        results = [None] * len(items)
+        for submodule_id, indexes in groups.items():
+            process = self.get_submodule(submodule_id).process
+            for index in indexes:
+                results[index] = process(items[index][1])
+        return results
+    
     def get_info(self) -> Dict[str, Any]:
         """
         Get module information.
@@ -74,11 +111,224 @@ class BaseModule(ABC):
         pass
 
 
+class SubmoduleTable(Mapping):
+    """
+    Read-only mapping of sub-module ID (1-9) to sub-module instance.
+    
+    Instances are held in a sequence indexed by ID - 1, so lookups index
+    straight into it instead of hashing the ID.
+    """
+    
+    __slots__ = ('_submodules',)
+    
+    def __init__(self, submodules: Sequence["BaseSubmodule"]):
+        """
+        Initialize the sub-module table.
+        
+        Args:
+            submodules: Sub-module instances, ordered by ID (index 0 is ID 1)
+        """
+        self._submodules = submodules
+    
+    def __getitem__(self, submodule_id: int) -> "BaseSubmodule":
+        return self._submodules[self._index(submodule_id)]
+    
+    def __contains__(self, submodule_id: object) -> bool:
+        return submodule_id in range(1, len(self._submodules) + 1)
+    
+    def __iter__(self):
+        return iter(range(1, len(self._submodules) + 1))
+    
+    def __len__(self) -> int:
+        return len(self._submodules)
+    
+    def _index(self, submodule_id: int) -> int:
+        # range.index() also places IDs given as equal numbers (e.g. 1.0),
+        # which the ID-keyed dicts used to accept
+        try:
+            return range(1, len(self._submodules) + 1).index(submodule_id)
+        except ValueError:
+            raise KeyError(submodule_id) from None
+
+
+class LazySubmodules(SubmoduleTable):
+    """
+    Sub-module table whose instances are only constructed on first access,
+    each with the "<prefix><id>" section of the owning module's configuration.
+    """
+    
+    __slots__ = ('_classes', '_prefix', '_config', '_lock')
+    
+    def __init__(self, classes: Sequence[Type["BaseSubmodule"]], prefix: str, config: Dict[str, Any]):
+        """
+        Initialize the lazy sub-module table.
+        
+        Args:
+            classes: Sub-module classes, ordered by ID (index 0 is ID 1)
+            prefix: Configuration key prefix (e.g. 'd' for d1-d9)
+            config: Owning module configuration
+        """
+        # Membership and iteration come from the (all-None) slot list, so
+        # they never force construction
+        super().__init__([None] * len(classes))
+        self._classes = classes
+        self._prefix = prefix
+        self._config = config
+        self._lock = Lock()
+    
+    def __getitem__(self, submodule_id: int) -> "BaseSubmodule":
+        index = self._index(submodule_id)
+        instance = self._submodules[index]
+        if instance is None:
+            # Double-checked so concurrent first lookups share one instance
+            with self._lock:
+                instance = self._submodules[index]
+                if instance is None:
+                    instance = self._classes[index](self._config.get(f"{self._prefix}{index + 1}", {}))
+                    self._submodules[index] = instance
+        return instance
+    
+    def __getstate__(self):
+        # Locks can be neither copied nor pickled; each copy gets its own
+        return self._submodules, self._classes, self._prefix, self._config
+    
+    def __setstate__(self, state):
+        self._submodules, self._classes, self._prefix, self._config = state
+        self._lock = Lock()
+
+
+class JSONResponseTemplate:
+    """
+    Compact JSON encoder for responses laid out like a fixed prototype.
+    
+    The static values of the prototype are encoded once; a None value marks
+    a per-request field, which is encoded on every render.
+    """
+    
+    __slots__ = ('_segments', '_tail')
+    
+    def __init__(self, prototype: Mapping[str, Any]):
+        """
+        Pre-encode the static parts of a response prototype.
+        
+        Args:
+            prototype: Response prototype, in response key order
+        """
+        segments = []
+        pending = '{'
+        for index, (key, value) in enumerate(prototype.items()):
+            if index:
+                pending += ','
+            pending += _dumps(key) + ':'
+            if value is None:
+                segments.append((pending, key))
+                pending = ''
+            else:
+                pending += _dumps(value)
+        self._segments = tuple(segments)
+        self._tail = pending + '}'
+    
+    def render(self, response: Mapping[str, Any]) -> bytes:
+        """
+        Encode a response built from the prototype.
+        
+        Args:
+            response: Response with the prototype's keys
+            
+        Returns:
+            UTF-8 JSON bytes, equal to encoding the response directly
+        """
+        parts = []
+        for prefix, key in self._segments:
+            parts.append(prefix)
+            parts.append(_dumps(response[key]))
+        parts.append(self._tail)
+        return ''.join(parts).encode()
+
+
+def _literal_source(value: Any) -> str:
+    """
+    Python source of a display expression that rebuilds a constant.
+    
+    Read-only mappings become dict displays and tuples become list
+    displays; strings, numbers, booleans and None are written as literals.
+    """
+    if isinstance(value, Mapping):
+        items = ', '.join(f"{key!r}: {_literal_source(item)}" for key, item in value.items())
+        return '{' + items + '}'
+    if isinstance(value, (tuple, list)):
+        return '[' + ', '.join(_literal_source(item) for item in value) + ']'
+    if type(value) is float and not math.isfinite(value):
+        raise ValueError(f"Non-finite float in response prototype: {value!r}")
+    if value is None or type(value) in (str, int, float, bool):
+        return repr(value)
+    raise TypeError(f"Unsupported value in response prototype: {type(value).__name__}")
+
+
+def _literal_factory(prototype: Mapping[str, Any]) -> Callable[..., Dict[str, Any]]:
+    """
+    Compile a response prototype into a function returning fresh copies.
+    
+    The function body is the prototype written out as one dict display, so
+    each call runs the same bytecode as a hand-written response literal:
+    constant strings are shared and only the containers are allocated.
+    Per-request (None) fields become keyword-only parameters, so callers
+    pass them in rather than assigning them afterwards.
+    
+    Args:
+        prototype: Response prototype made of mappings, tuples and literals
+        
+    Returns:
+        Function returning a new plain dict (with plain nested dicts and
+        lists) equal to the prototype with the given fields filled in
+    """
+    fields = [key for key, value in prototype.items() if value is None]
+    for key in fields:
+        if not isinstance(key, str) or not key.isidentifier() or keyword.iskeyword(key):
+            raise ValueError(f"Per-request field name is not an identifier: {key!r}")
+    
+    items = ', '.join(
+        f"{key!r}: {key if value is None else _literal_source(value)}"
+        for key, value in prototype.items()
+    )
+    params = '*, ' + ', '.join(f"{key}=None" for key in fields) if fields else ''
+    return eval(f"lambda {params}: {{{items}}}", {})
+
+
 class BaseSubmodule(ABC):
     """
     Base class for all sub-modules.
     """
     
+    __slots__ = ('config', 'model_version', 'model_quality')
+    
+    DESCRIPTION = ""
+    
+    # Optional response prototype (static values, None for per-request
+    # fields); when a sub-module sets it, _new_response(**fields) returns a
+    # fresh copy of it and process_json() only encodes the per-request fields
+    _RESPONSE: Optional[Mapping[str, Any]] = None
+    _RESPONSE_JSON: Optional[JSONResponseTemplate] = None
+    _new_response: Optional[Callable[..., Dict[str, Any]]] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '_RESPONSE' in cls.__dict__ and cls._RESPONSE is not None:
+            cls._RESPONSE_JSON = JSONResponseTemplate(cls._RESPONSE)
+            cls._new_response = staticmethod(_literal_factory(cls._RESPONSE))
+        
+        # get_description() is not abstract, so concrete sub-modules must
+        # either set DESCRIPTION or override it themselves
+        is_abstract = any(
+            getattr(getattr(cls, name, None), '__isabstractmethod__', False)
+            for name in dir(cls)
+        )
+        if (not is_abstract and not cls.DESCRIPTION
+                and cls.get_description is BaseSubmodule.get_description):
+            raise TypeError(
+                f"{cls.__name__} must set a non-empty DESCRIPTION or override get_description()"
+            )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize sub-module.
@@ -114,6 +364,34 @@ class BaseSubmodule(ABC):
         """
         pass
     
+    def process_json(self, request: Dict[str, Any]) -> bytes:
+        """
+        Process a request and return the response encoded as compact JSON.
+        
+        Args:
+            request: Request data
+            
+        Returns:
+            UTF-8 JSON bytes of the process() response
+        """
+        response = self.process(request)
+        if self._RESPONSE_JSON is None:
+            return _dumps(response).encode()
+        return self._RESPONSE_JSON.render(response)
+    
+    def process_many(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of requests.
+        
+        Args:
+            requests: Request data, one entry per request
+            
+        Returns:
+            Response data, in request order
+        """
+        process = self.process
+        return [process(request) for request in requests]
+    
     def set_model_version(self, version: int):
         """
         Set the model version for this submodule.
@@ -179,13 +457,13 @@ class BaseSubmodule(ABC):
             "model_quality": self.model_quality[self.model_version]
         }
     
-    @abstractmethod
     def get_description(self) -> str:
         """
         Get sub-module description.
-        Must be implemented by each sub-module.
+        Sub-modules set the class-level DESCRIPTION constant (or override this);
+        concrete sub-modules without either are rejected at class creation.
         
         Returns:
             Sub-module description
         """
-        pass 
\ No newline at end of file
+        return self.DESCRIPTION 
\ No newline at end of file
@@ -32,6 +32,8 @@ class CoderModule(BaseModule):
 class C1CodeGeneration(BaseSubmodule):
     """c1: Generate code based on requirements and specifications."""
     
+    DESCRIPTION = "Generate code based on requirements and specifications"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         requirements = request.get('requirements', '')
         language = request.get('language', 'python')
@@ -88,14 +90,13 @@ function {requirements.lower().replace(" ", "_")}() {{
             'Add comprehensive documentation',
             'Consider edge cases'
         ]
-    
-    def get_description(self) -> str:
-        return "Generate code based on requirements and specifications"
 
 
 class C2CodeReview(BaseSubmodule):
     """c2: Review code for quality, best practices, and potential issues."""
     
+    DESCRIPTION = "Review code for quality, best practices, and potential issues"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         language = request.get('language', 'python')
@@ -133,14 +134,13 @@ class C2CodeReview(BaseSubmodule):
             if result['status'] == 'fail':
                 priority_issues.extend(result['issues'])
         return priority_issues[:3]  # Top 3 priority issues
-    
-    def get_description(self) -> str:
-        return "Review code for quality, best practices, and potential issues"
 
 
 class C3BugDetection(BaseSubmodule):
     """c3: Detect and identify bugs in code."""
     
+    DESCRIPTION = "Detect and identify bugs in code"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         language = request.get('language', 'python')
@@ -189,14 +189,13 @@ class C3BugDetection(BaseSubmodule):
     
     def _suggest_fixes(self, bugs: List[Dict[str, Any]]) -> List[str]:
         return [bug['suggestion'] for bug in bugs]
-    
-    def get_description(self) -> str:
-        return "Detect and identify bugs in code"
 
 
 class C4Refactoring(BaseSubmodule):
     """c4: Refactor code to improve structure, readability, and maintainability."""
     
+    DESCRIPTION = "Refactor code to improve structure, readability, and maintainability"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         refactoring_goals = request.get('goals', ['readability', 'performance'])
@@ -247,14 +246,13 @@ class C4Refactoring(BaseSubmodule):
             'complexity': {'original': 5, 'refactored': 3},
             'readability_score': {'original': 70, 'refactored': 85}
         }
-    
-    def get_description(self) -> str:
-        return "Refactor code to improve structure, readability, and maintainability"
 
 
 class C5Documentation(BaseSubmodule):
     """c5: Generate and improve code documentation."""
     
+    DESCRIPTION = "Generate and improve code documentation"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         doc_type = request.get('doc_type', 'comprehensive')
@@ -375,14 +373,13 @@ Description of return value
             'examples': 'Needs improvement',
             'overall_score': 82.5
         }
-    
-    def get_description(self) -> str:
-        return "Generate and improve code documentation"
 
 
 class C6Testing(BaseSubmodule):
     """c6: Generate and manage test cases for code."""
     
+    DESCRIPTION = "Generate and manage test cases for code"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         test_type = request.get('test_type', 'unit')
@@ -482,14 +479,13 @@ test_data = [
             'test_readability': 'Excellent',
             'maintainability': 'High'
         }
-    
-    def get_description(self) -> str:
-        return "Generate and manage test cases for code"
 
 
 class C7ArchitectureDesign(BaseSubmodule):
     """c7: Design and analyze software architecture."""
     
+    DESCRIPTION = "Design and analyze software architecture"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         requirements = request.get('requirements', [])
         constraints = request.get('constraints', {})
@@ -539,14 +535,13 @@ class C7ArchitectureDesign(BaseSubmodule):
             'database_scaling': 'Consider read replicas and sharding',
             'caching_strategy': 'Redis for session and data caching'
         }
-    
-    def get_description(self) -> str:
-        return "Design and analyze software architecture"
 
 
 class C8PerformanceOptimization(BaseSubmodule):
     """c8: Optimize code and system performance."""
     
+    DESCRIPTION = "Optimize code and system performance"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         performance_metrics = request.get('metrics', {})
@@ -622,14 +617,13 @@ class C8PerformanceOptimization(BaseSubmodule):
             'Parallel processing',
             'Memory management'
         ]
-    
-    def get_description(self) -> str:
-        return "Optimize code and system performance"
 
 
 class C9CodeAnalysis(BaseSubmodule):
     """c9: Analyze code complexity, maintainability, and quality metrics."""
     
+    DESCRIPTION = "Analyze code complexity, maintainability, and quality metrics"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         code = request.get('code', '')
         analysis_type = request.get('analysis_type', 'comprehensive')
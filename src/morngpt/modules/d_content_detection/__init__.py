@@ -0,0 +1,28 @@
+"""
+mornGPT content detection module (d1-d9).
+
+The implementation module is only imported the first time one of its
+classes is accessed from this package (PEP 562).
+"""
+
+import importlib
+
+__all__ = [
+    "ContentDetectionModule",
+    "D1TextDetection",
+    "D2ImageDetection",
+    "D3AudioDetection",
+    "D4VideoDetection",
+    "D5DeepfakeDetection",
+    "D6ManipulationDetection",
+    "D7AuthenticityVerification",
+    "D8ForensicAnalysis",
+    "D9DetectionReporting"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(".content_detection", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
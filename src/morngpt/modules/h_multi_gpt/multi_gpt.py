@@ -2,8 +2,43 @@
 Multi-GPT module for advanced prompt orchestration and management.
 """
 
+import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List
-from .base import BaseModule, BaseSubmodule
+from .base import BaseModule, BaseSubmodule, LazySubmodules
+
+
+# Keyword checks are single alternations, so a prompt is scanned once rather
+# than once per keyword. They run on the lowercased prompt (not IGNORECASE)
+# to keep the exact `keyword in prompt.lower()` semantics.
+_UNSAFE_KEYWORDS_RE = re.compile(r'harmful|dangerous|illegal')
+_THREAT_INDICATORS_RE = re.compile(r'exploit|injection|bypass')
+
+# Model routing keywords, tested in this order
+_CREATIVE_KEYWORDS_RE = re.compile(r'creative|art')
+_CODE_KEYWORDS_RE = re.compile(r'code|programming')
+
+# Routing only depends on the prompt text, so repeat prompts skip re-scanning.
+# Only prompts of up to _ROUTING_CACHE_MAX_PROMPT characters are memoized, so
+# the cache holds at most 512 x 1,000 characters (about 0.5 MB of ASCII text,
+# 2 MB at worst); longer prompts are routed without it
+_ROUTING_CACHE_SIZE = 512
+_ROUTING_CACHE_MAX_PROMPT = 1000
+
+
+def _route_prompt(prompt: str) -> str:
+    # Simple model selection logic
+    prompt = prompt.lower()
+    if _CREATIVE_KEYWORDS_RE.search(prompt):
+        return 'gpt-4'
+    elif _CODE_KEYWORDS_RE.search(prompt):
+        return 'claude'
+    else:
+        return 'gpt-3.5-turbo'
+
+
+_route_short_prompt = lru_cache(maxsize=_ROUTING_CACHE_SIZE)(_route_prompt)
 
 
 class MultiGPTModule(BaseModule):
@@ -12,18 +47,8 @@ class MultiGPTModule(BaseModule):
     """
     
     def _initialize_submodules(self):
-        """Initialize h1-h9 submodules."""
-        self.submodules = {
-            1: H1PromptOrchestrator(self.config.get('h1', {})),
-            2: H2PromptChaining(self.config.get('h2', {})),
-            3: H3PromptOptimization(self.config.get('h3', {})),
-            4: H4MultiModelRouting(self.config.get('h4', {})),
-            5: H5PromptTemplates(self.config.get('h5', {})),
-            6: H6ContextManagement(self.config.get('h6', {})),
-            7: H7PromptValidation(self.config.get('h7', {})),
-            8: H8PromptAnalytics(self.config.get('h8', {})),
-            9: H9PromptSecurity(self.config.get('h9', {}))
-        }
+        """Initialize h1-h9 submodules (constructed lazily on first access)."""
+        self.submodules = LazySubmodules(_SUBMODULE_CLASSES, 'h', self.config)
     
     def get_description(self) -> str:
         return "Advanced multi-GPT prompt orchestration and management system"
@@ -32,14 +57,15 @@ class MultiGPTModule(BaseModule):
 class H1PromptOrchestrator(BaseSubmodule):
     """h1: Advanced prompt orchestration across multiple GPT models."""
     
+    DESCRIPTION = "Advanced prompt orchestration across multiple GPT models"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         prompts = request.get('prompts', [])
         models = request.get('models', ['gpt-4', 'gpt-3.5-turbo'])
         
         # Orchestrate prompts across multiple models
-        results = {}
-        for model in models:
-            results[model] = self._process_with_model(prompts, model)
+        process_with_model = self._process_with_model
+        results = {model: process_with_model(prompts, model) for model in models}
         
         return {
             'orchestrated_results': results,
@@ -48,16 +74,17 @@ class H1PromptOrchestrator(BaseSubmodule):
         }
     
     def _process_with_model(self, prompts: List[str], model: str) -> List[Dict[str, Any]]:
-        # Simulate processing with different models
-        return [{'prompt': p, 'model': model, 'response': f'Response from {model}'} for p in prompts]
-    
-    def get_description(self) -> str:
-        return "Advanced prompt orchestration across multiple GPT models"
+        # Simulate processing with different models; the response text only
+        # depends on the model, so it is formatted once per model
+        response = f'Response from {model}'
+        return [{'prompt': p, 'model': model, 'response': response} for p in prompts]
 
 
 class H2PromptChaining(BaseSubmodule):
     """h2: Chain multiple prompts together for complex workflows."""
     
+    DESCRIPTION = "Chain multiple prompts together for complex workflows"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         chain = request.get('chain', [])
         context = request.get('context', {})
@@ -83,14 +110,22 @@ class H2PromptChaining(BaseSubmodule):
             'input': context,
             'output': {'result': f'Processed step: {step.get("name")}'}
         }
-    
-    def get_description(self) -> str:
-        return "Chain multiple prompts together for complex workflows"
 
 
 class H3PromptOptimization(BaseSubmodule):
     """h3: Optimize prompts for better performance and results."""
     
+    DESCRIPTION = "Optimize prompts for better performance and results"
+    
+    # (prefix, suffix) wrapped around the prompt per optimization type
+    _OPTIMIZATION_AFFIXES = MappingProxyType({
+        'general': ('Optimized: ', ' [Enhanced for clarity and precision]'),
+        'creative': ('Creative: ', ' [Enhanced for imagination and originality]'),
+        'analytical': ('Analytical: ', ' [Enhanced for logical reasoning]')
+    })
+    
+    _IMPROVEMENTS = ('Enhanced clarity', 'Better structure', 'Improved specificity')
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         prompt = request.get('prompt', '')
         optimization_type = request.get('optimization_type', 'general')
@@ -105,60 +140,63 @@ class H3PromptOptimization(BaseSubmodule):
         }
     
     def _optimize_prompt(self, prompt: str, optimization_type: str) -> str:
-        # Simulate prompt optimization
-        optimizations = {
-            'general': f"Optimized: {prompt} [Enhanced for clarity and precision]",
-            'creative': f"Creative: {prompt} [Enhanced for imagination and originality]",
-            'analytical': f"Analytical: {prompt} [Enhanced for logical reasoning]"
-        }
-        return optimizations.get(optimization_type, prompt)
+        # Simulate prompt optimization; only the selected variant is built
+        affixes = self._OPTIMIZATION_AFFIXES.get(optimization_type)
+        if affixes is None:
+            return prompt
+        prefix, suffix = affixes
+        return f"{prefix}{prompt}{suffix}"
     
     def _get_improvements(self, original: str, optimized: str) -> List[str]:
-        return ['Enhanced clarity', 'Better structure', 'Improved specificity']
-    
-    def get_description(self) -> str:
-        return "Optimize prompts for better performance and results"
+        return list(self._IMPROVEMENTS)
 
 
 class H4MultiModelRouting(BaseSubmodule):
     """h4: Route prompts to the most appropriate model based on content."""
     
+    DESCRIPTION = "Route prompts to the most appropriate model based on content"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         prompt = request.get('prompt', '')
         available_models = request.get('available_models', ['gpt-4', 'gpt-3.5-turbo', 'claude'])
         
-        best_model = self._select_best_model(prompt, available_models)
+        best_model = self._select_best_model(prompt)
         result = self._process_with_model(prompt, best_model)
         
         return {
             'selected_model': best_model,
-            'reasoning': self._get_selection_reasoning(prompt, best_model),
+            'reasoning': self._get_selection_reasoning(best_model),
             'result': result,
             'alternative_models': [m for m in available_models if m != best_model]
         }
     
-    def _select_best_model(self, prompt: str, models: List[str]) -> str:
-        # Simple model selection logic
-        if 'creative' in prompt.lower() or 'art' in prompt.lower():
-            return 'gpt-4'
-        elif 'code' in prompt.lower() or 'programming' in prompt.lower():
-            return 'claude'
-        else:
-            return 'gpt-3.5-turbo'
+    @staticmethod
+    def _select_best_model(prompt: str) -> str:
+        if len(prompt) <= _ROUTING_CACHE_MAX_PROMPT:
+            return _route_short_prompt(prompt)
+        return _route_prompt(prompt)
     
-    def _get_selection_reasoning(self, prompt: str, model: str) -> str:
+    @staticmethod
+    def _get_selection_reasoning(model: str) -> str:
         return f"Selected {model} based on prompt content analysis"
     
     def _process_with_model(self, prompt: str, model: str) -> Dict[str, Any]:
         return {'response': f'Processed by {model}', 'model': model}
-    
-    def get_description(self) -> str:
-        return "Route prompts to the most appropriate model based on content"
 
 
 class H5PromptTemplates(BaseSubmodule):
     """h5: Manage and apply prompt templates for common use cases."""
     
+    DESCRIPTION = "Manage and apply prompt templates for common use cases"
+    
+    # Built-in templates (read-only, shared across requests)
+    _TEMPLATES = MappingProxyType({
+        'code_review': 'Please review this code: {code}\nFocus on: {focus_areas}',
+        'creative_writing': 'Write a {genre} story about {topic} with {style} style',
+        'analysis': 'Analyze {subject} from the perspective of {perspective}'
+    })
+    _DEFAULT_TEMPLATE = 'Default template: {input}'
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         template_name = request.get('template', '')
         variables = request.get('variables', {})
@@ -174,56 +212,58 @@ class H5PromptTemplates(BaseSubmodule):
         }
     
     def _get_template(self, template_name: str) -> str:
-        templates = {
-            'code_review': 'Please review this code: {code}\nFocus on: {focus_areas}',
-            'creative_writing': 'Write a {genre} story about {topic} with {style} style',
-            'analysis': 'Analyze {subject} from the perspective of {perspective}'
-        }
-        return templates.get(template_name, 'Default template: {input}')
+        return self._TEMPLATES.get(template_name, self._DEFAULT_TEMPLATE)
     
     def _fill_template(self, template: str, variables: Dict[str, Any]) -> str:
         try:
-            return template.format(**variables)
+            # format_map reads the variables in place instead of copying
+            # them into a keyword-argument dict
+            return template.format_map(variables)
         except KeyError:
             return template
-    
-    def get_description(self) -> str:
-        return "Manage and apply prompt templates for common use cases"
 
 
 class H6ContextManagement(BaseSubmodule):
     """h6: Manage context and conversation history for multi-turn interactions."""
     
+    DESCRIPTION = "Manage context and conversation history for multi-turn interactions"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         conversation = request.get('conversation', [])
         max_context_length = request.get('max_context_length', 4000)
         
-        managed_context = self._manage_context(conversation, max_context_length)
+        # The conversation is rendered once; its length drives both the
+        # truncation decision and the reported sizes
+        original_length = len(str(conversation))
+        managed_context = self._manage_context(conversation, original_length, max_context_length)
+        if managed_context is conversation:
+            managed_length = original_length
+        else:
+            managed_length = len(str(managed_context))
         
         return {
-            'original_length': len(str(conversation)),
-            'managed_length': len(str(managed_context)),
+            'original_length': original_length,
+            'managed_length': managed_length,
             'managed_context': managed_context,
             'context_summary': self._generate_summary(conversation)
         }
     
-    def _manage_context(self, conversation: List[Dict], max_length: int) -> List[Dict]:
+    def _manage_context(self, conversation: List[Dict], length: int, max_length: int) -> List[Dict]:
         # Simulate context management
-        if len(str(conversation)) > max_length:
+        if length > max_length:
             # Truncate and summarize
             return conversation[-3:]  # Keep last 3 exchanges
         return conversation
     
     def _generate_summary(self, conversation: List[Dict]) -> str:
         return f"Conversation with {len(conversation)} exchanges"
-    
-    def get_description(self) -> str:
-        return "Manage context and conversation history for multi-turn interactions"
 
 
 class H7PromptValidation(BaseSubmodule):
     """h7: Validate prompts for safety, quality, and compliance."""
     
+    DESCRIPTION = "Validate prompts for safety, quality, and compliance"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         prompt = request.get('prompt', '')
         
@@ -244,8 +284,7 @@ class H7PromptValidation(BaseSubmodule):
     
     def _validate_safety(self, prompt: str) -> bool:
         # Simulate safety validation
-        unsafe_keywords = ['harmful', 'dangerous', 'illegal']
-        return not any(keyword in prompt.lower() for keyword in unsafe_keywords)
+        return _UNSAFE_KEYWORDS_RE.search(prompt.lower()) is None
     
     def _validate_quality(self, prompt: str) -> bool:
         # Simulate quality validation
@@ -262,14 +301,13 @@ class H7PromptValidation(BaseSubmodule):
         if not validation_results['quality']:
             suggestions.append('Improve prompt clarity and specificity')
         return suggestions
-    
-    def get_description(self) -> str:
-        return "Validate prompts for safety, quality, and compliance"
 
 
 class H8PromptAnalytics(BaseSubmodule):
     """h8: Analyze prompt performance and generate insights."""
     
+    DESCRIPTION = "Analyze prompt performance and generate insights"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         prompts = request.get('prompts', [])
         responses = request.get('responses', [])
@@ -285,14 +323,14 @@ class H8PromptAnalytics(BaseSubmodule):
     def _analyze_prompts(self, prompts: List[str]) -> Dict[str, Any]:
         return {
             'total_prompts': len(prompts),
-            'avg_length': sum(len(p) for p in prompts) / len(prompts) if prompts else 0,
+            'avg_length': sum(map(len, prompts)) / len(prompts) if prompts else 0,
             'complexity_score': self._calculate_complexity(prompts)
         }
     
     def _analyze_responses(self, responses: List[str]) -> Dict[str, Any]:
         return {
             'total_responses': len(responses),
-            'avg_length': sum(len(r) for r in responses) / len(responses) if responses else 0,
+            'avg_length': sum(map(len, responses)) / len(responses) if responses else 0,
             'quality_score': self._calculate_quality(responses)
         }
     
@@ -310,14 +348,13 @@ class H8PromptAnalytics(BaseSubmodule):
             "Performance is within expected parameters",
             "Consider optimizing prompt length for better efficiency"
         ]
-    
-    def get_description(self) -> str:
-        return "Analyze prompt performance and generate insights"
 
 
 class H9PromptSecurity(BaseSubmodule):
     """h9: Implement security measures for prompt handling and processing."""
     
+    DESCRIPTION = "Implement security measures for prompt handling and processing"
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         prompt = request.get('prompt', '')
         security_level = request.get('security_level', 'standard')
@@ -343,8 +380,7 @@ class H9PromptSecurity(BaseSubmodule):
     
     def _detect_threats(self, prompt: str) -> bool:
         # Simulate threat detection
-        threat_indicators = ['exploit', 'injection', 'bypass']
-        return not any(indicator in prompt.lower() for indicator in threat_indicators)
+        return _THREAT_INDICATORS_RE.search(prompt.lower()) is None
     
     def _check_access_control(self, request: Dict[str, Any]) -> bool:
         # Simulate access control check
@@ -361,6 +397,17 @@ class H9PromptSecurity(BaseSubmodule):
         if not security_checks['access_control']:
             recommendations.append('Implement proper access control')
         return recommendations
-    
-    def get_description(self) -> str:
-        return "Implement security measures for prompt handling and processing" 
\ No newline at end of file
+
+
+# h1-h9 in sub-module ID order
+_SUBMODULE_CLASSES = (
+    H1PromptOrchestrator,
+    H2PromptChaining,
+    H3PromptOptimization,
+    H4MultiModelRouting,
+    H5PromptTemplates,
+    H6ContextManagement,
+    H7PromptValidation,
+    H8PromptAnalytics,
+    H9PromptSecurity,
+)
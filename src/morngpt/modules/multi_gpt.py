@@ -2,16 +2,63 @@
 Multi-GPT Prompts module for advanced prompt orchestration and management.
 """
 
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 from .base import BaseModule, BaseSubmodule
 import json
 import time
 import uuid
 
 
+# The orchestration header and model instructions only depend on a few short
+# request settings, so repeat settings skip re-building them
+_ORCHESTRATION_CACHE_SIZE = 512
+
+_QUALITY_CONTROLS = """[QUALITY CONTROLS]
+- Fact verification enabled
+- Bias detection active
+- Safety filters engaged
+- Output validation required"""
+
+
+def _cost_table(base_cost: float, version_step: float) -> Tuple[float, ...]:
+    """Per-request cost for model versions 1-9."""
+    return tuple(
+        round(base_cost * (1 + (version - 1) * version_step), 4)
+        for version in range(1, 10)
+    )
+
+
+def _tier_table(standard: int, professional: int, enterprise: int) -> Tuple[str, ...]:
+    """Subscription tier for model versions 1-9, given each tier's first version."""
+    tiers = []
+    for version in range(1, 10):
+        if version >= enterprise:
+            tiers.append("Enterprise")
+        elif version >= professional:
+            tiers.append("Professional")
+        elif version >= standard:
+            tiers.append("Standard")
+        else:
+            tiers.append("Basic")
+    return tuple(tiers)
+
+
 class H1PromptOrchestrator(BaseSubmodule):
     """Advanced prompt orchestration with multi-model coordination."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.01, 0.2)
+    _TIERS = _tier_table(4, 6, 8)
+    
+    # (model family, instruction) pairs; a model gets the first family it names
+    _MODEL_INSTRUCTIONS = (
+        ('gpt', "[GPT: Optimize for reasoning and analysis]"),
+        ('claude', "[Claude: Focus on safety and helpfulness]"),
+        ('gemini', "[Gemini: Emphasize creativity and innovation]")
+    )
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt orchestration request."""
         prompt = request.get('prompt', '')
@@ -50,17 +97,23 @@ class H1PromptOrchestrator(BaseSubmodule):
     
     def _enhanced_orchestration(self, prompt: str, models: List[str], strategy: str, complexity: str) -> str:
         """Enhanced orchestration for v7+ models."""
-        enhanced_prompt = f"""
-[SYSTEM: Multi-Model Orchestration v{self.model_version}]
+        header = self._orchestration_header(self.model_version, strategy, complexity, len(models))
+        return "\n".join((
+            header + self._add_context_enhancement(prompt),
+            self._add_model_specific_instructions(models),
+            self._add_quality_controls()
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=_ORCHESTRATION_CACHE_SIZE)
+    def _orchestration_header(model_version: int, strategy: str, complexity: str, model_count: int) -> str:
+        """Build the enhanced orchestration header."""
+        return f"""[SYSTEM: Multi-Model Orchestration v{model_version}]
 [STRATEGY: {strategy.upper()}]
 [COMPLEXITY: {complexity.upper()}]
-[COORDINATION: {len(models)} models]
+[COORDINATION: {model_count} models]
 
-{self._add_context_enhancement(prompt)}
-{self._add_model_specific_instructions(models)}
-{self._add_quality_controls()}
-        """.strip()
-        return enhanced_prompt
+"""
     
     def _standard_orchestration(self, prompt: str, models: List[str], strategy: str) -> str:
         """Standard orchestration for v4-6 models."""
@@ -87,53 +140,53 @@ class H1PromptOrchestrator(BaseSubmodule):
     def _add_model_specific_instructions(self, models: List[str]) -> str:
         """Add model-specific instructions."""
         if self.model_version >= 6:
-            instructions = []
-            for model in models:
-                if 'gpt' in model.lower():
-                    instructions.append(f"[GPT: Optimize for reasoning and analysis]")
-                elif 'claude' in model.lower():
-                    instructions.append(f"[Claude: Focus on safety and helpfulness]")
-                elif 'gemini' in model.lower():
-                    instructions.append(f"[Gemini: Emphasize creativity and innovation]")
-            return '\n'.join(instructions)
+            return self._instructions_for(tuple(models))
         return ""
     
+    @classmethod
+    @lru_cache(maxsize=_ORCHESTRATION_CACHE_SIZE)
+    def _instructions_for(cls, models: Tuple[str, ...]) -> str:
+        """Build the instruction lines for a set of models."""
+        instructions = []
+        for model in models:
+            model = model.lower()
+            for family, instruction in cls._MODEL_INSTRUCTIONS:
+                if family in model:
+                    instructions.append(instruction)
+                    break
+        return '\n'.join(instructions)
+    
     def _add_quality_controls(self) -> str:
         """Add quality control measures."""
         if self.model_version >= 7:
-            return """
-[QUALITY CONTROLS]
-- Fact verification enabled
-- Bias detection active
-- Safety filters engaged
-- Output validation required
-            """.strip()
+            return _QUALITY_CONTROLS
         return ""
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.01
-        version_multiplier = 1 + (self.model_version - 1) * 0.2
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 8:
-            return "Enterprise"
-        elif self.model_version >= 6:
-            return "Professional"
-        elif self.model_version >= 4:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Advanced prompt orchestration with multi-model coordination"
 
 
+_CHAIN_STEP_FOOTER = """
+
+[CONTEXT: Previous step output will be provided]
+[VALIDATION: Quality checks enabled]"""
+
+
 class H2PromptChaining(BaseSubmodule):
     """Chain multiple prompts for complex workflows."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.015, 0.15)
+    _TIERS = _tier_table(3, 5, 7)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt chaining request."""
         prompts = request.get('prompts', [])
@@ -165,21 +218,21 @@ class H2PromptChaining(BaseSubmodule):
     
     def _advanced_chaining(self, prompts: List[str], chain_type: str, output_format: str) -> List[str]:
         """Advanced chaining for v6+ models."""
-        chained = []
-        for i, prompt in enumerate(prompts):
-            enhanced_prompt = f"""
-[CHAIN STEP {i+1}/{len(prompts)}]
-[CHAIN TYPE: {chain_type.upper()}]
+        if not prompts:
+            return []
+        
+        # Everything after the step line is the same for every step,
+        # so it is formatted once per chain
+        step_count = len(prompts)
+        header = f"""[CHAIN TYPE: {chain_type.upper()}]
 [OUTPUT FORMAT: {output_format.upper()}]
 [VERSION: v{self.model_version}]
 
-{prompt}
-
-[CONTEXT: Previous step output will be provided]
-[VALIDATION: Quality checks enabled]
-            """.strip()
-            chained.append(enhanced_prompt)
-        return chained
+"""
+        return [
+            f"[CHAIN STEP {i}/{step_count}]\n{header}{prompt}{_CHAIN_STEP_FOOTER}"
+            for i, prompt in enumerate(prompts, 1)
+        ]
     
     def _standard_chaining(self, prompts: List[str], chain_type: str) -> List[str]:
         """Standard chaining for v3-5 models."""
@@ -195,20 +248,11 @@ class H2PromptChaining(BaseSubmodule):
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.015
-        version_multiplier = 1 + (self.model_version - 1) * 0.15
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 7:
-            return "Enterprise"
-        elif self.model_version >= 5:
-            return "Professional"
-        elif self.model_version >= 3:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Chain multiple prompts for complex workflows"
@@ -217,6 +261,10 @@ class H2PromptChaining(BaseSubmodule):
 class H3PromptOptimization(BaseSubmodule):
     """Optimize prompts for better performance and cost efficiency."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.008, 0.1)
+    _TIERS = _tier_table(2, 4, 6)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt optimization request."""
         original_prompt = request.get('prompt', '')
@@ -230,13 +278,15 @@ class H3PromptOptimization(BaseSubmodule):
         else:
             optimized_prompt = self._basic_optimization(original_prompt)
         
+        token_reduction = self._calculate_token_reduction(original_prompt, optimized_prompt)
+        
         return {
             'original_prompt': original_prompt,
             'optimized_prompt': optimized_prompt,
             'optimization_metrics': {
-                'token_reduction': self._calculate_token_reduction(original_prompt, optimized_prompt),
+                'token_reduction': token_reduction,
                 'performance_improvement': min(0.95, 0.6 + (self.model_version * 0.04)),
-                'cost_savings': self._calculate_cost_savings(original_prompt, optimized_prompt)
+                'cost_savings': self._calculate_cost_savings(token_reduction)
             },
             'api_usage': {
                 'endpoint': '/api/v1/prompt/optimize',
@@ -283,27 +333,17 @@ class H3PromptOptimization(BaseSubmodule):
             return round((original_tokens - optimized_tokens) / original_tokens * 100, 2)
         return 0.0
     
-    def _calculate_cost_savings(self, original: str, optimized: str) -> float:
-        """Calculate cost savings."""
-        token_reduction = self._calculate_token_reduction(original, optimized)
+    def _calculate_cost_savings(self, token_reduction: float) -> float:
+        """Calculate cost savings from the token reduction percentage."""
         return round(token_reduction * 0.01, 4)
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.008
-        version_multiplier = 1 + (self.model_version - 1) * 0.1
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 6:
-            return "Enterprise"
-        elif self.model_version >= 4:
-            return "Professional"
-        elif self.model_version >= 2:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Optimize prompts for better performance and cost efficiency"
@@ -312,6 +352,18 @@ class H3PromptOptimization(BaseSubmodule):
 class H4PromptTemplates(BaseSubmodule):
     """Manage and apply prompt templates for common use cases."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.005, 0.08)
+    _TIERS = _tier_table(2, 3, 5)
+    
+    _TEMPLATES = MappingProxyType({
+        'general': "You are a helpful AI assistant. Please help with: {task}",
+        'creative': "You are a creative writer. Create: {content_type} about {topic}",
+        'analytical': "You are an analyst. Analyze: {subject} and provide insights",
+        'educational': "You are a teacher. Explain: {concept} to {audience}",
+        'business': "You are a business consultant. Advise on: {business_need}"
+    })
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt template request."""
         template_name = request.get('template_name', 'general')
@@ -363,38 +415,24 @@ class H4PromptTemplates(BaseSubmodule):
     
     def _get_template_by_name(self, name: str) -> str:
         """Get template by name."""
-        templates = {
-            'general': "You are a helpful AI assistant. Please help with: {task}",
-            'creative': "You are a creative writer. Create: {content_type} about {topic}",
-            'analytical': "You are an analyst. Analyze: {subject} and provide insights",
-            'educational': "You are a teacher. Explain: {concept} to {audience}",
-            'business': "You are a business consultant. Advise on: {business_need}"
-        }
-        return templates.get(name, templates['general'])
+        return self._TEMPLATES.get(name, self._TEMPLATES['general'])
     
     def _apply_variables(self, template: str, variables: Dict[str, Any]) -> str:
         """Apply variables to template."""
         try:
-            return template.format(**variables)
+            # format_map reads the variables in place instead of copying
+            # them into a keyword-argument dict
+            return template.format_map(variables)
         except KeyError:
             return template
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.005
-        version_multiplier = 1 + (self.model_version - 1) * 0.08
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 5:
-            return "Enterprise"
-        elif self.model_version >= 3:
-            return "Professional"
-        elif self.model_version >= 2:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Manage and apply prompt templates for common use cases"
@@ -403,6 +441,10 @@ class H4PromptTemplates(BaseSubmodule):
 class H5PromptAnalysis(BaseSubmodule):
     """Analyze prompts for quality, effectiveness, and potential improvements."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.012, 0.12)
+    _TIERS = _tier_table(3, 5, 7)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt analysis request."""
         prompt = request.get('prompt', '')
@@ -430,6 +472,7 @@ class H5PromptAnalysis(BaseSubmodule):
     
     def _advanced_analysis(self, prompt: str, analysis_type: str) -> Dict[str, Any]:
         """Advanced analysis for v6+ models."""
+        word_count = len(prompt.split())
         return {
             'clarity_score': 0.85 + (self.model_version * 0.01),
             'specificity_score': 0.80 + (self.model_version * 0.015),
@@ -437,8 +480,8 @@ class H5PromptAnalysis(BaseSubmodule):
             'token_efficiency': 0.78 + (self.model_version * 0.02),
             'bias_detection': self.model_version >= 7,
             'safety_assessment': self.model_version >= 8,
-            'complexity_analysis': self._analyze_complexity(prompt),
-            'improvement_areas': self._identify_improvements(prompt)
+            'complexity_analysis': self._analyze_complexity(word_count),
+            'improvement_areas': self._identify_improvements(prompt, word_count)
         }
     
     def _standard_analysis(self, prompt: str, analysis_type: str) -> Dict[str, Any]:
@@ -459,19 +502,18 @@ class H5PromptAnalysis(BaseSubmodule):
             'token_efficiency': 0.55
         }
     
-    def _analyze_complexity(self, prompt: str) -> Dict[str, Any]:
+    def _analyze_complexity(self, word_count: int) -> Dict[str, Any]:
         """Analyze prompt complexity."""
-        words = prompt.split()
         return {
-            'word_count': len(words),
-            'complexity_level': 'medium' if len(words) > 50 else 'simple',
+            'word_count': word_count,
+            'complexity_level': 'medium' if word_count > 50 else 'simple',
             'readability_score': 0.75
         }
     
-    def _identify_improvements(self, prompt: str) -> List[str]:
+    def _identify_improvements(self, prompt: str, word_count: int) -> List[str]:
         """Identify areas for improvement."""
         improvements = []
-        if len(prompt.split()) < 10:
+        if word_count < 10:
             improvements.append("Consider adding more context")
         if '?' not in prompt:
             improvements.append("Consider making the prompt more specific")
@@ -488,20 +530,11 @@ class H5PromptAnalysis(BaseSubmodule):
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.012
-        version_multiplier = 1 + (self.model_version - 1) * 0.12
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 7:
-            return "Enterprise"
-        elif self.model_version >= 5:
-            return "Professional"
-        elif self.model_version >= 3:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Analyze prompts for quality, effectiveness, and potential improvements"
@@ -510,6 +543,10 @@ class H5PromptAnalysis(BaseSubmodule):
 class H6PromptTesting(BaseSubmodule):
     """Test prompts with various inputs and evaluate performance."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.020, 0.15)
+    _TIERS = _tier_table(2, 4, 6)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt testing request."""
         prompt = request.get('prompt', '')
@@ -598,20 +635,11 @@ class H6PromptTesting(BaseSubmodule):
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.020
-        version_multiplier = 1 + (self.model_version - 1) * 0.15
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 6:
-            return "Enterprise"
-        elif self.model_version >= 4:
-            return "Professional"
-        elif self.model_version >= 2:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Test prompts with various inputs and evaluate performance"
@@ -620,9 +648,18 @@ class H6PromptTesting(BaseSubmodule):
 class H7PromptVersioning(BaseSubmodule):
     """Manage different versions of prompts and track changes."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.006, 0.08)
+    _TIERS = _tier_table(2, 3, 5)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt versioning request."""
-        prompt_id = request.get('prompt_id', str(uuid.uuid4()))
+        # Only generate an ID when the request has none (a get() default
+        # would be built on every call)
+        if 'prompt_id' in request:
+            prompt_id = request['prompt_id']
+        else:
+            prompt_id = str(uuid.uuid4())
         prompt_content = request.get('prompt_content', '')
         version_notes = request.get('version_notes', '')
         action = request.get('action', 'create')
@@ -720,20 +757,11 @@ class H7PromptVersioning(BaseSubmodule):
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.006
-        version_multiplier = 1 + (self.model_version - 1) * 0.08
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 5:
-            return "Enterprise"
-        elif self.model_version >= 3:
-            return "Professional"
-        elif self.model_version >= 2:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Manage different versions of prompts and track changes"
@@ -742,6 +770,10 @@ class H7PromptVersioning(BaseSubmodule):
 class H8PromptSecurity(BaseSubmodule):
     """Ensure prompt security and prevent prompt injection attacks."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.010, 0.12)
+    _TIERS = _tier_table(3, 5, 7)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt security request."""
         prompt = request.get('prompt', '')
@@ -852,20 +884,11 @@ class H8PromptSecurity(BaseSubmodule):
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.010
-        version_multiplier = 1 + (self.model_version - 1) * 0.12
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 7:
-            return "Enterprise"
-        elif self.model_version >= 5:
-            return "Professional"
-        elif self.model_version >= 3:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Ensure prompt security and prevent prompt injection attacks"
@@ -874,6 +897,10 @@ class H8PromptSecurity(BaseSubmodule):
 class H9PromptAnalytics(BaseSubmodule):
     """Analyze prompt usage patterns and performance metrics."""
     
+    # Cost and subscription tier only depend on the model version
+    _COSTS = _cost_table(0.015, 0.10)
+    _TIERS = _tier_table(2, 4, 6)
+    
     def process(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process prompt analytics request."""
         analytics_period = request.get('analytics_period', '7d')
@@ -1009,20 +1036,11 @@ class H9PromptAnalytics(BaseSubmodule):
     
     def _calculate_cost(self) -> float:
         """Calculate cost based on model version."""
-        base_cost = 0.015
-        version_multiplier = 1 + (self.model_version - 1) * 0.10
-        return round(base_cost * version_multiplier, 4)
+        return self._COSTS[self.model_version - 1]
     
     def _get_subscription_tier(self) -> str:
         """Get subscription tier based on model version."""
-        if self.model_version >= 6:
-            return "Enterprise"
-        elif self.model_version >= 4:
-            return "Professional"
-        elif self.model_version >= 2:
-            return "Standard"
-        else:
-            return "Basic"
+        return self._TIERS[self.model_version - 1]
     
     def get_description(self) -> str:
         return "Analyze prompt usage patterns and performance metrics"
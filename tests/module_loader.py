@@ -0,0 +1,34 @@
+"""
+Load module files from src/morngpt/modules for the tests.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+
+MODULES_DIR = Path(__file__).resolve().parent.parent / "src" / "morngpt" / "modules"
+
+# The sub-module packages import their base with "from .base import ...", so
+# every module file is loaded into one synthetic package next to base.py
+_PACKAGE = "_morngpt_modules_under_test"
+
+
+def load_module(relative_path: str) -> types.ModuleType:
+    """Load a module file from src/morngpt/modules into the synthetic package."""
+    if _PACKAGE not in sys.modules:
+        package = types.ModuleType(_PACKAGE)
+        package.__path__ = []
+        sys.modules[_PACKAGE] = package
+    if relative_path != "base.py":
+        load_module("base.py")
+    # Named after the whole relative path: several packages share file names
+    # (e.g. multi_gpt.py and h_multi_gpt/multi_gpt.py)
+    name = f"{_PACKAGE}.{Path(relative_path).with_suffix('').as_posix().replace('/', '__')}"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, MODULES_DIR / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
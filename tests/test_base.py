@@ -0,0 +1,387 @@
+"""
+Tests for the shared module/sub-module infrastructure in modules/base.py.
+"""
+
+import copy
+import json
+import pickle
+import threading
+import time
+import types
+from collections.abc import Mapping
+
+import pytest
+
+from module_loader import load_module
+
+
+base = load_module("base.py")
+
+
+class _Echo(base.BaseSubmodule):
+    """Sub-module that echoes its request and records its configuration."""
+
+    DESCRIPTION = "Echo the request"
+
+    def process(self, request):
+        return {"request": request, "config": dict(self.config)}
+
+
+class _Templated(base.BaseSubmodule):
+    """Sub-module whose responses follow a fixed prototype."""
+
+    DESCRIPTION = "Answer from a prototype"
+
+    _RESPONSE = types.MappingProxyType({
+        "question": None,
+        "sources": ("Manual", "FAQ"),
+        "answer": None,
+        "confidence": 0.5,
+    })
+
+    def process(self, request):
+        question = request.get("question", "")
+        return {
+            "question": question,
+            "sources": ["Manual", "FAQ"],
+            "answer": f"Answer to {question}",
+            "confidence": 0.5,
+        }
+
+
+class _SlowEcho(_Echo):
+    """Echo sub-module whose construction is slow enough to race on."""
+
+    instances = 0
+    instances_lock = threading.Lock()
+
+    def __init__(self, config):
+        with _SlowEcho.instances_lock:
+            _SlowEcho.instances += 1
+        time.sleep(0.05)
+        super().__init__(config)
+
+
+class _EchoModule(base.BaseModule):
+    """Module serving three echo sub-modules from a lazy table."""
+
+    def _initialize_submodules(self):
+        self.submodules = base.LazySubmodules((_Echo, _Echo, _Echo), "x", self.config)
+
+    def get_description(self):
+        return "Echo module"
+
+
+# SubmoduleTable
+
+
+def test_submodule_table_mapping_contract():
+    first, second = _Echo({}), _Echo({})
+    table = base.SubmoduleTable([first, second])
+
+    assert isinstance(table, Mapping)
+    assert len(table) == 2
+    assert list(table) == [1, 2]
+    assert list(table.keys()) == [1, 2]
+    assert list(table.values()) == [first, second]
+    assert dict(table.items()) == {1: first, 2: second}
+    assert table[1] is first and table[2] is second
+    assert 1 in table and 2 in table
+    assert 0 not in table and 3 not in table and "1" not in table
+    assert table.get(3) is None
+    assert table == {1: first, 2: second}
+
+
+@pytest.mark.parametrize("submodule_id", [0, 3, -1, "1", 1.5, None])
+def test_submodule_table_rejects_unknown_ids(submodule_id):
+    table = base.SubmoduleTable([_Echo({}), _Echo({})])
+
+    with pytest.raises(KeyError):
+        table[submodule_id]
+
+
+def test_submodule_table_accepts_equal_numeric_ids():
+    first, second = _Echo({}), _Echo({})
+    table = base.SubmoduleTable([first, second])
+
+    assert table[1.0] is first and table[2.0] is second
+    with pytest.raises(KeyError):
+        table[1.5]
+
+
+# LazySubmodules
+
+
+def test_lazy_submodules_construct_on_first_access():
+    table = base.LazySubmodules((_Echo, _Echo, _Echo), "x", {"x2": {"level": 2}})
+
+    # Membership, length and iteration never construct a sub-module
+    assert len(table) == 3
+    assert list(table) == [1, 2, 3]
+    assert 2 in table and 4 not in table
+    assert table._submodules == [None, None, None]
+
+    second = table[2]
+    assert isinstance(second, _Echo)
+    assert table._submodules == [None, second, None]
+    assert table[2] is second
+
+
+def test_lazy_submodules_pass_config_sections():
+    config = {"x1": {"level": 1}}
+    table = base.LazySubmodules((_Echo, _Echo), "x", config)
+
+    assert table[1].config is config["x1"]
+    assert table[2].config == {}
+
+    # IDs given as equal numbers still find their own section
+    assert base.LazySubmodules((_Echo,), "x", config)[1.0].config is config["x1"]
+
+
+def test_lazy_submodules_reject_unknown_ids():
+    table = base.LazySubmodules((_Echo,), "x", {})
+
+    with pytest.raises(KeyError):
+        table[2]
+    assert table._submodules == [None]
+
+
+def test_lazy_submodules_concurrent_first_access_shares_one_instance():
+    _SlowEcho.instances = 0
+    table = base.LazySubmodules((_SlowEcho,), "x", {})
+    threads_count = 8
+    barrier = threading.Barrier(threads_count)
+    seen = []
+
+    def lookup():
+        barrier.wait()
+        seen.append(table[1])
+
+    threads = [threading.Thread(target=lookup) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(seen) == threads_count
+    assert all(instance is seen[0] for instance in seen)
+    assert _SlowEcho.instances == 1
+
+
+def test_lazy_submodules_give_each_unconfigured_submodule_its_own_config():
+    table = base.LazySubmodules((_Echo, _Echo), "x", {})
+
+    assert table[1].config == {} and type(table[1].config) is dict
+    assert table[1].config is not table[2].config
+
+    # Sub-modules stay copyable and picklable
+    for clone in (copy.deepcopy(table[1]), pickle.loads(pickle.dumps(table[1]))):
+        assert type(clone) is _Echo
+        assert clone.config == {}
+        assert clone.process({"n": 1}) == table[1].process({"n": 1})
+
+
+@pytest.mark.parametrize("clone", [copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))])
+def test_lazy_submodules_copy_and_pickle(clone):
+    module = _EchoModule({"x2": {"level": 2}})
+    second = module.get_submodule(2)
+
+    copied = clone(module)
+    assert isinstance(copied.submodules, base.LazySubmodules)
+    assert copied.submodules._submodules[0] is None
+    assert copied.submodules._submodules[1] is not second
+    assert copied.submodules._lock is not module.submodules._lock
+    assert copied.get_submodule(2).config == {"level": 2}
+    assert copied.get_submodule(1).process({"n": 1}) == module.get_submodule(1).process({"n": 1})
+
+
+# Batch processing
+
+
+def test_process_many_keeps_request_order():
+    submodule = _Echo({})
+    requests = [{"n": n} for n in range(5)]
+
+    assert submodule.process_many(requests) == [submodule.process(r) for r in requests]
+    assert submodule.process_many([]) == []
+
+
+def test_process_batch_keeps_item_order():
+    module = _EchoModule({"x3": {"level": 3}})
+    items = [(3, {"n": 0}), (1, {"n": 1}), (3, {"n": 2}), (2, {"n": 3})]
+
+    assert module.process_batch(items) == [
+        {"request": {"n": 0}, "config": {"level": 3}},
+        {"request": {"n": 1}, "config": {}},
+        {"request": {"n": 2}, "config": {"level": 3}},
+        {"request": {"n": 3}, "config": {}},
+    ]
+    assert module.process_batch([]) == []
+
+
+def test_process_batch_rejects_unknown_submodules():
+    module = _EchoModule({})
+
+    with pytest.raises(ValueError):
+        module.process_batch([(1, {}), (10, {})])
+
+
+# JSON encoding
+
+
+def test_json_response_template_matches_json_dumps():
+    prototype = types.MappingProxyType({
+        "title": "Static",
+        "request": None,
+        "details": types.MappingProxyType({"tags": ("a", "b"), "score": 0.5}),
+        "result": None,
+        "unicode": "café",
+    })
+    template = base.JSONResponseTemplate(prototype)
+    response = {
+        "title": "Static",
+        "request": {"q": "x", "n": [1, 2]},
+        "details": {"tags": ["a", "b"], "score": 0.5},
+        "result": None,
+        "unicode": "café",
+    }
+
+    assert template.render(response) == json.dumps(response, separators=(",", ":")).encode()
+
+
+def test_json_response_template_without_per_request_fields():
+    template = base.JSONResponseTemplate({"a": 1, "b": [True, None]})
+
+    assert template.render({"a": 1, "b": [True, None]}) == b'{"a":1,"b":[true,null]}'
+
+
+@pytest.mark.parametrize("submodule_class", [_Echo, _Templated])
+def test_process_json_encodes_the_process_response(submodule_class):
+    submodule = submodule_class({})
+    request = {"question": "café?", "n": [1, 2]}
+
+    assert submodule.process_json(request) == json.dumps(
+        submodule.process(request), separators=(",", ":")
+    ).encode()
+
+
+def test_new_response_returns_fresh_plain_copies():
+    first, second = _Templated._new_response(), _Templated._new_response()
+
+    assert first == {"question": None, "sources": ["Manual", "FAQ"], "answer": None, "confidence": 0.5}
+    assert type(first) is dict and type(first["sources"]) is list
+    assert first is not second and first["sources"] is not second["sources"]
+    assert _Echo._new_response is None
+
+
+def test_new_response_fills_per_request_fields():
+    response = _Templated._new_response(question="q", answer="a")
+
+    assert response == {"question": "q", "sources": ["Manual", "FAQ"], "answer": "a", "confidence": 0.5}
+    assert list(response) == list(_Templated._RESPONSE)
+    with pytest.raises(TypeError):
+        _Templated._new_response("q")
+    with pytest.raises(TypeError):
+        _Templated._new_response(confidence=1.0)
+
+
+@pytest.mark.parametrize("prototype", [
+    {"value": float("nan")},
+    {"value": {1, 2}},
+    {"not an identifier": None},
+    {"class": None},
+])
+def test_response_prototype_rejects_unsupported_layouts(prototype):
+    with pytest.raises((TypeError, ValueError)):
+        class _Bad(_Echo):
+            _RESPONSE = prototype
+
+
+# Sub-module descriptions
+
+
+def test_concrete_submodule_requires_description():
+    with pytest.raises(TypeError):
+        class _Undescribed(base.BaseSubmodule):
+            def process(self, request):
+                return {}
+
+
+def test_description_may_come_from_override_or_abstract_base():
+    class _Overridden(base.BaseSubmodule):
+        def process(self, request):
+            return {}
+
+        def get_description(self):
+            return "Overridden"
+
+    # Abstract intermediates do not need a description of their own
+    class _Intermediate(base.BaseSubmodule):
+        pass
+
+    assert _Overridden({}).get_description() == "Overridden"
+    assert _Echo({}).get_description() == "Echo the request"
+
+
+# Real modules: process_json() must encode exactly what process() returns,
+# and the returned responses must survive JSON and pickle round trips
+
+
+_MODULES = [
+    ("a_growth_advisory/growth_advisory.py", "GrowthAdvisoryModule"),
+    ("b_interview_job/interview_job.py", "InterviewJobModule"),
+    ("d_content_detection/content_detection.py", "ContentDetectionModule"),
+    ("e_medical_advice/medical_advice.py", "MedicalAdviceModule"),
+    ("h_multi_gpt/multi_gpt.py", "MultiGPTModule"),
+]
+
+
+def _clear_containers(value):
+    """Empty every dict and list nested in a response, innermost first."""
+    if isinstance(value, dict):
+        for item in value.values():
+            _clear_containers(item)
+        value.clear()
+    elif isinstance(value, list):
+        for item in value:
+            _clear_containers(item)
+        value.clear()
+
+
+def _submodules():
+    for path, module_name in _MODULES:
+        module_class = getattr(load_module(path), module_name)
+        for submodule_id in range(1, 10):
+            yield pytest.param(module_class, submodule_id, id=f"{module_name}-{submodule_id}")
+
+
+@pytest.mark.parametrize("module_class,submodule_id", list(_submodules()))
+def test_submodule_responses_serialize(module_class, submodule_id):
+    submodule = module_class({}).get_submodule(submodule_id)
+
+    for version in (1, 5, 9):
+        submodule.set_model_version(version)
+        response = submodule.process({})
+
+        encoded = json.dumps(response, separators=(",", ":")).encode()
+        assert submodule.process_json({}) == encoded
+        assert json.loads(encoded) == response
+        assert pickle.loads(pickle.dumps(response)) == response
+
+        # Responses are the caller's to mutate; later calls must not see it
+        _clear_containers(response)
+        assert submodule.process_json({}) == encoded
+
+
+@pytest.mark.parametrize("path,module_name", _MODULES)
+def test_modules_construct_submodules_lazily(path, module_name):
+    module = getattr(load_module(path), module_name)({})
+
+    assert isinstance(module.submodules, base.LazySubmodules)
+    assert module.submodules._submodules == [None] * 9
+    assert list(module.submodules) == list(range(1, 10))
+    assert module.get_submodule(4) is module.get_submodule(4)
+    assert module.get_submodule(1.0) is module.get_submodule(1)
+
+    copied = pickle.loads(pickle.dumps(module))
+    assert copied.get_submodule(4).process({}) == module.get_submodule(4).process({})
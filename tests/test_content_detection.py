@@ -0,0 +1,50 @@
+"""
+Tests for the content detection sub-modules in modules/d_content_detection.
+"""
+
+import pytest
+
+from module_loader import load_module
+
+
+content_detection = load_module("d_content_detection/content_detection.py")
+
+_INDICATORS = ["repetitive_patterns", "unnatural_flow", "inconsistent_style", "ai_markers"]
+
+
+def _detect_text(request):
+    return content_detection.ContentDetectionModule({}).get_submodule(1).process(request)
+
+
+@pytest.mark.parametrize("request_data", [{}, {"text": ""}])
+def test_empty_text_scores_zero(request_data):
+    response = _detect_text(request_data)
+
+    assert response["detection_result"] == {
+        "is_fake": False,
+        "fake_score": 0.0,
+        "indicators": dict.fromkeys(_INDICATORS, 0.0),
+        "confidence": 0.0,
+    }
+    assert response["fake_probability"] == 0.0
+    assert response["evidence"] == []
+
+
+def test_empty_text_indicators_are_fresh_dicts():
+    first = _detect_text({})["detection_result"]["indicators"]
+    first["ai_markers"] = 1.0
+
+    assert type(first) is dict
+    assert _detect_text({})["detection_result"]["indicators"]["ai_markers"] == 0.0
+
+
+def test_text_is_scored():
+    response = _detect_text({"text": "Generated SYNTHETIC text text", "confidence": 0.2})
+    result = response["detection_result"]
+
+    assert list(result["indicators"]) == _INDICATORS
+    assert result["indicators"]["ai_markers"] == pytest.approx(0.4)
+    assert result["indicators"]["repetitive_patterns"] == pytest.approx(0.5)
+    assert result["fake_score"] == pytest.approx(0.4)
+    assert result["is_fake"] is True
+    assert response["fake_probability"] == pytest.approx(40.0)
@@ -0,0 +1,66 @@
+"""
+Tests for the multi-GPT sub-modules in modules/h_multi_gpt.
+"""
+
+import pytest
+
+from module_loader import load_module
+
+
+h_multi_gpt = load_module("h_multi_gpt/multi_gpt.py")
+
+
+def _submodule(submodule_id):
+    return h_multi_gpt.MultiGPTModule({}).get_submodule(submodule_id)
+
+
+# H4 routing
+
+
+@pytest.mark.parametrize("prompt,model", [
+    ("Paint some ART", "gpt-4"),
+    ("A creative take on code", "gpt-4"),
+    ("Review this Programming task", "claude"),
+    ("Summarize the news", "gpt-3.5-turbo"),
+    ("", "gpt-3.5-turbo"),
+])
+def test_routing_selects_model_by_keyword(prompt, model):
+    response = _submodule(4).process({"prompt": prompt, "available_models": ["gpt-4", "claude"]})
+
+    assert response["selected_model"] == model
+    assert response["reasoning"] == f"Selected {model} based on prompt content analysis"
+    assert response["alternative_models"] == [m for m in ["gpt-4", "claude"] if m != model]
+
+
+def test_routing_memoizes_short_prompts_only():
+    h_multi_gpt._route_short_prompt.cache_clear()
+    long_prompt = "x" * h_multi_gpt._ROUTING_CACHE_MAX_PROMPT + " code"
+
+    for _ in range(2):
+        assert _submodule(4).process({"prompt": "write code"})["selected_model"] == "claude"
+        assert _submodule(4).process({"prompt": long_prompt})["selected_model"] == "claude"
+
+    info = h_multi_gpt._route_short_prompt.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+# H6 context management
+
+
+def test_context_lengths_without_truncation():
+    conversation = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    response = _submodule(6).process({"conversation": conversation})
+
+    assert response["managed_context"] is conversation
+    assert response["original_length"] == response["managed_length"] == len(str(conversation))
+    assert response["context_summary"] == "Conversation with 2 exchanges"
+
+
+def test_context_lengths_after_truncation():
+    conversation = [{"role": "user", "content": f"message {n}"} for n in range(6)]
+    response = _submodule(6).process({"conversation": conversation, "max_context_length": 10})
+
+    assert response["managed_context"] == conversation[-3:]
+    assert response["original_length"] == len(str(conversation))
+    assert response["managed_length"] == len(str(conversation[-3:]))
+    assert response["context_summary"] == "Conversation with 6 exchanges"
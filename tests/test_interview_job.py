@@ -0,0 +1,44 @@
+"""
+Tests for the interview/job sub-modules in modules/b_interview_job.
+"""
+
+import pytest
+
+from module_loader import load_module
+
+
+interview_job = load_module("b_interview_job/interview_job.py")
+
+
+def _skill_gaps(current, target):
+    submodule = interview_job.InterviewJobModule({}).get_submodule(6)
+    response = submodule.process({"current_skills": current, "target_skills": target})
+    return response["development_plan"]["skill_gaps"]
+
+
+def test_skill_gaps_keep_target_order_and_duplicates():
+    assert _skill_gaps(["python", "sql"], ["go", "python", "rust", "go"]) == ["go", "rust", "go"]
+    assert _skill_gaps([], []) == []
+
+
+@pytest.mark.parametrize("size", [3, 40])
+def test_skill_gaps_match_a_list_scan(size):
+    current = [f"skill{n}" for n in range(0, 2 * size, 2)]
+    target = [f"skill{n}" for n in range(size)]
+
+    assert _skill_gaps(current, target) == [skill for skill in target if skill not in current]
+    assert _skill_gaps(tuple(current), tuple(target)) == [skill for skill in target if skill not in current]
+
+
+@pytest.mark.parametrize("size", [3, 40])
+def test_skill_gaps_accept_unhashable_skills(size):
+    current = [{"name": f"skill{n}"} for n in range(size)]
+    target = [{"name": "skill0"}, {"name": "new"}] * size
+
+    assert _skill_gaps(current, target) == [{"name": "new"}] * size
+    assert _skill_gaps([f"skill{n}" for n in range(size)], target) == target
+
+
+def test_skill_gaps_keep_string_containment():
+    # A plain string of current skills is still tested by substring
+    assert _skill_gaps("abc", ["a", "x", "ab"]) == ["x"]
@@ -0,0 +1,58 @@
+"""
+Tests for the prompt orchestration sub-modules in modules/multi_gpt.py.
+"""
+
+import uuid
+
+import pytest
+
+from module_loader import load_module
+
+
+multi_gpt = load_module("multi_gpt.py")
+
+
+@pytest.mark.parametrize("version", [6, 9])
+def test_advanced_chain_steps(version):
+    submodule = multi_gpt.H2PromptChaining({})
+    submodule.set_model_version(version)
+    response = submodule.process({
+        "prompts": ["Outline the essay", "Write it"],
+        "chain_type": "sequential",
+        "output_format": "markdown",
+    })
+
+    assert response["chained_prompts"] == [
+        f"[CHAIN STEP {step}/2]\n"
+        "[CHAIN TYPE: SEQUENTIAL]\n"
+        "[OUTPUT FORMAT: MARKDOWN]\n"
+        f"[VERSION: v{version}]\n"
+        "\n"
+        f"{prompt}\n"
+        "\n"
+        "[CONTEXT: Previous step output will be provided]\n"
+        "[VALIDATION: Quality checks enabled]"
+        for step, prompt in ((1, "Outline the essay"), (2, "Write it"))
+    ]
+
+
+def test_advanced_chain_without_prompts():
+    submodule = multi_gpt.H2PromptChaining({})
+    submodule.set_model_version(9)
+
+    assert submodule.process({})["chained_prompts"] == []
+
+
+@pytest.mark.parametrize("prompt_id", ["prompt-42", "", None])
+def test_versioning_keeps_the_given_prompt_id(prompt_id):
+    submodule = multi_gpt.H7PromptVersioning({})
+
+    assert submodule.process({"prompt_id": prompt_id})["prompt_id"] == prompt_id
+
+
+def test_versioning_generates_a_prompt_id_when_none_is_given():
+    submodule = multi_gpt.H7PromptVersioning({})
+    first, second = submodule.process({})["prompt_id"], submodule.process({})["prompt_id"]
+
+    assert str(uuid.UUID(first)) == first
+    assert first != second